@@ -0,0 +1,71 @@
+"""Patterns and templates shared by the tool-module generation scripts."""
+
+import re
+from bisect import bisect_left
+
+# numpy is optional; when present, newline offsets are found with one vectorized compare
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tool-context attributes rewritten from ``self.<attr>`` to ``ctx.<attr>`` in one pass
+SELF_ATTR_RE = re.compile(
+    r"self\.(mcp|device_manager|monitor|grafana_dashboard|taildrop_manager|magic_dns_manager|funnel_manager"
+    r"|network_ops|policy_ops|audit_ops|tag_ops|key_ops|policy_analyzer|analytics_ops|reporting_ops|service_ops)"
+)
+
+# Standalone @self.mcp.tool() decorator lines; the generated register function adds its own
+MCP_TOOL_DECORATOR_RE = re.compile(r"^\s*@self\.mcp\.tool\(\)\s*$", re.MULTILINE)
+
+# Closing line of a tool signature: ``) -> dict[str, Any]:`` (or a one-line ``def f(...) -> ...:``)
+SIG_END_RE = re.compile(r"\)\s*->\s*dict\[str,\s*Any\]:\s*$")
+
+# Module header shared by every generated tool module; the tool function follows it
+MODULE_HEADER = '''"""Tailscale {title} tool module."""
+
+from typing import Any
+
+import structlog
+
+from tailscalemcp.exceptions import TailscaleMCPError
+
+from ._base import ToolContext
+
+logger = structlog.get_logger(__name__)
+
+
+def register_{slug}_tool(ctx: ToolContext) -> None:
+    """Register the {tool_name} tool.
+
+    Args:
+        ctx: Tool context with all managers and MCP instance
+    """
+    @ctx.mcp.tool()
+'''
+
+
+def newline_offsets(buf) -> list[int]:
+    """Return the byte offset of every newline in ``buf`` (bytes or mmap)."""
+    if np is not None:
+        return np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == 0x0A).tolist()
+    offsets = []
+    pos = buf.find(b"\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = buf.find(b"\n", pos + 1)
+    return offsets
+
+
+def line_of(newlines: list[int], pos: int) -> int:
+    """Map a byte offset to its 0-based line number using a newline_offsets() table."""
+    return bisect_left(newlines, pos)
+
+
+def line_start(newlines: list[int], line: int) -> int | None:
+    """Return the byte offset where ``line`` (0-based) starts, or None past the last line."""
+    if line == 0:
+        return 0
+    if line - 1 < len(newlines):
+        return newlines[line - 1] + 1
+    return None
@@ -1,40 +1,52 @@
 """Extract tools from portmanteau_tools.py into separate modules."""
 
+import mmap
 import re
 from pathlib import Path
 
-# Read the original file
+from _tool_codegen import line_of, line_start, newline_offsets
+
+TOOL_RE = re.compile(rb"async def (tailscale_\w+)")
+DECO = b"@self.mcp.tool()"
+END_MARKER = b'logger.info("All portmanteau tools registered'
+# How many lines after a decorator the async def may appear
+DEF_LOOKAHEAD = 10
+
+# Map the original file and work on byte offsets; lines are never materialized
 source_file = Path("src/tailscalemcp/tools/portmanteau_tools.py")
-content = source_file.read_text(encoding="utf-8")
-lines = content.split("\n")
-
-# Find all tool definitions
-tool_starts = []
-for i, line in enumerate(lines):
-    if "@self.mcp.tool()" in line:
-        # Find the async def line
-        for j in range(i, min(i + 10, len(lines))):
-            if "async def tailscale_" in lines[j]:
-                tool_match = re.search(r"async def (tailscale_\w+)", lines[j])
-                if tool_match:
-                    tool_starts.append((tool_match.group(1), i, j))
-                    break
-
-# Find end of each tool
-tool_ranges = []
-for idx, (tool_name, _decorator_line, def_line) in enumerate(tool_starts):
-    if idx + 1 < len(tool_starts):
-        end_line = tool_starts[idx + 1][1] - 1
-    else:
-        # Last tool - find end of _register_tools
-        for j in range(def_line, len(lines)):
-            if 'logger.info("All portmanteau tools registered' in lines[j]:
-                end_line = j - 1
-                break
+with source_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    # Byte offsets of every newline, computed once; line numbers are bisected from it
+    newlines = newline_offsets(mm)
+    total_lines = len(newlines) + 1
+
+    # Find all tool definitions: jump from decorator to decorator and pair each with
+    # the first tool definition within DEF_LOOKAHEAD lines
+    tool_starts = []
+    last_def_at = 0
+    deco_at = mm.find(DECO)
+    while deco_at != -1:
+        line_no = line_of(newlines, deco_at)
+        window_start = line_start(newlines, line_no)
+        window_end = line_start(newlines, line_no + DEF_LOOKAHEAD)
+        tool_match = TOOL_RE.search(mm, window_start, len(mm) if window_end is None else window_end)
+        if tool_match:
+            tool_starts.append((tool_match.group(1).decode(), line_no, line_of(newlines, tool_match.start())))
+            last_def_at = tool_match.start()
+
+        next_line = line_start(newlines, line_no + 1)
+        deco_at = -1 if next_line is None else mm.find(DECO, next_line)
+
+    # Find end of each tool
+    tool_ranges = []
+    for idx, (tool_name, _decorator_line, def_line) in enumerate(tool_starts):
+        if idx + 1 < len(tool_starts):
+            end_line = tool_starts[idx + 1][1] - 1
         else:
-            end_line = len(lines) - 1
+            # Last tool - find end of _register_tools
+            marker_at = mm.find(END_MARKER, last_def_at)
+            end_line = line_of(newlines, marker_at) - 1 if marker_at != -1 else total_lines - 1
 
-    tool_ranges.append((tool_name, def_line, end_line))
+        tool_ranges.append((tool_name, def_line, end_line))
 
 # Print tool ranges for manual extraction
 print("Tool extraction ranges:")
@@ -1,5 +1,6 @@
 """Fix indentation in all tool files."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 tool_files = [
@@ -15,43 +16,54 @@ tool_files = [
     "integration_tool.py",
 ]
 
-for tool_file in tool_files:
-    file_path = Path(f"src/tailscalemcp/tools/{tool_file}")
-    if not file_path.exists():
-        continue
+TOOLS_DIR = Path("src/tailscalemcp/tools")
 
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    fixed_lines = []
+
+def fix_file(tool_file: str) -> str:
+    """Fix one tool file in place and return a status line.
+
+    The fixes only touch ASCII indentation, so the file is processed as bytes.
+    """
+    file_path = TOOLS_DIR / tool_file
+    content = original = file_path.read_bytes()
+    # Lines map 1:1 to their fixed form, so changed lines are rewritten in place by index
+    lines = content.splitlines(keepends=True)
     past_docstring = False
 
     for i, line in enumerate(lines):
-        if "async def tailscale_" in line:
+        if b"async def tailscale_" in line:
             past_docstring = False
-            fixed_lines.append(line)
             continue
 
-        if not past_docstring and line.strip() == '"""' and i > 10:
+        if not past_docstring and line.strip() == b'"""' and i > 10:
             past_docstring = True
-            fixed_lines.append(line)
             continue
 
-        if past_docstring and line.strip():
-            current_indent = len(line) - len(line.lstrip())
-            if current_indent == 12 and not line.startswith('            """'):
-                fixed_lines.append("        " + line[12:])
-            elif current_indent == 16:
-                fixed_lines.append("            " + line[16:])
-            elif current_indent == 20:
-                fixed_lines.append("                " + line[20:])
-            elif current_indent == 24:
-                fixed_lines.append("                    " + line[24:])
-            else:
-                fixed_lines.append(line)
-        else:
-            fixed_lines.append(line)
-
-    file_path.write_text("\n".join(fixed_lines), encoding="utf-8")
-    print(f"Fixed {tool_file}")
-
-print("Done")
+        stripped = line.lstrip()
+        current_indent = len(line) - len(stripped)
+        # Body lines sit one level too deep: drop 4 spaces from every 4-aligned indent >= 12
+        if (
+            past_docstring
+            and stripped
+            and current_indent >= 12
+            and current_indent % 4 == 0
+            and not (current_indent == 12 and stripped.startswith(b'"""'))
+        ):
+            lines[i] = b" " * (current_indent - 4) + stripped
+
+    new_content = b"".join(lines)
+    if new_content == original:
+        return f"Unchanged {tool_file}"
+    file_path.write_bytes(new_content)
+    return f"Fixed {tool_file}"
+
+
+if __name__ == "__main__":
+    existing = [tool_file for tool_file in tool_files if (TOOLS_DIR / tool_file).exists()]
+
+    # Files are independent; fix them across worker processes
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(fix_file, existing):
+            print(message)
+
+    print("Done")
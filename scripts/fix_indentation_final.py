@@ -1,6 +1,7 @@
 """Final fix for indentation - ensure try/except blocks are properly indented."""
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 tool_files = [
@@ -15,18 +16,25 @@ tool_files = [
     "integration_tool.py",
 ]
 
-for tool_file in tool_files:
-    file_path = Path(f"src/tailscalemcp/tools/{tool_file}")
-    if not file_path.exists():
-        continue
+TOOLS_DIR = Path("src/tailscalemcp/tools")
 
-    content = file_path.read_text(encoding="utf-8")
+
+def fix_file(tool_file: str) -> str:
+    """Fix one tool file in place and return a status line.
+
+    The fixes only touch ASCII indentation, so the file is processed as bytes. CRLF
+    line endings are normalized for matching and restored on write.
+    """
+    file_path = TOOLS_DIR / tool_file
+    raw = file_path.read_bytes()
+    crlf = b"\r\n" in raw
+    content = original = raw.replace(b"\r\n", b"\n") if crlf else raw
 
     # Fix pattern: """\n        try:\n        if -> """\n        try:\n            if
     # The try block should be at 8 spaces, and its contents at 12 spaces
     content = re.sub(
-        r'(""")\n        try:\n        (if|elif)',
-        r"\1\n        try:\n            \2",
+        rb'(""")\n        try:\n        (if|elif)',
+        rb"\1\n        try:\n            \2",
         content,
         flags=re.MULTILINE,
     )
@@ -34,29 +42,33 @@ for tool_file in tool_files:
     # Fix: if/elif statements that should be indented under try
     # Pattern: \n        if operation == -> \n            if operation ==
     # But only after try:
-    lines = content.split("\n")
-    fixed_lines = []
+    # Lines map 1:1 to their fixed form, so changed lines are rewritten in place by index
+    lines = content.splitlines(keepends=True)
     in_try_block = False
 
-    for _i, line in enumerate(lines):
-        if "        try:" in line:
+    for i, line in enumerate(lines):
+        if b"        try:" in line:
             in_try_block = True
-            fixed_lines.append(line)
-        elif in_try_block and line.strip().startswith(("if ", "elif ", "else:")):
+        elif in_try_block and line.strip().startswith((b"if ", b"elif ", b"else:")):
             # These should be at 12 spaces (indented under try)
-            if line.startswith("        ") and not line.startswith("            "):
-                fixed_lines.append("            " + line[8:])
-            else:
-                fixed_lines.append(line)
-        elif (in_try_block and line.strip() == "except Exception as e:") or (
-            in_try_block and line.strip().startswith("except")
-        ):
+            if line.startswith(b"        ") and not line.startswith(b"            "):
+                lines[i] = b"            " + line[8:]
+        elif in_try_block and line.strip().startswith(b"except"):
             in_try_block = False
-            fixed_lines.append(line)
-        else:
-            fixed_lines.append(line)
 
-    file_path.write_text("\n".join(fixed_lines), encoding="utf-8")
-    print(f"Fixed {tool_file}")
+    new_content = b"".join(lines)
+    if new_content == original:
+        return f"Unchanged {tool_file}"
+    file_path.write_bytes(new_content.replace(b"\n", b"\r\n") if crlf else new_content)
+    return f"Fixed {tool_file}"
+
+
+if __name__ == "__main__":
+    existing = [tool_file for tool_file in tool_files if (TOOLS_DIR / tool_file).exists()]
+
+    # Files are independent; fix them across worker processes
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(fix_file, existing):
+            print(message)
 
-print("Done")
+    print("Done")
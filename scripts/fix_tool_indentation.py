@@ -1,5 +1,6 @@
 """Fix indentation in generated tool files."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 tool_files = [
@@ -15,14 +16,18 @@ tool_files = [
     "integration_tool.py",
 ]
 
-for tool_file in tool_files:
-    file_path = Path(f"src/tailscalemcp/tools/{tool_file}")
-    if not file_path.exists():
-        continue
+TOOLS_DIR = Path("src/tailscalemcp/tools")
 
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    fixed_lines = []
+
+def fix_file(tool_file: str) -> str:
+    """Fix one tool file in place and return a status line.
+
+    The fixes only touch ASCII indentation, so the file is processed as bytes.
+    """
+    file_path = TOOLS_DIR / tool_file
+    content = original = file_path.read_bytes()
+    # Lines map 1:1 to their fixed form, so changed lines are rewritten in place by index
+    lines = content.splitlines(keepends=True)
     in_function = False
     docstring_ended = False
 
@@ -31,59 +36,64 @@ for tool_file in tool_files:
         line = lines[i]
 
         # Detect start of async def
-        if "async def tailscale_" in line:
+        if b"async def tailscale_" in line:
             in_function = True
             docstring_ended = False
-            fixed_lines.append(line)
             i += 1
             continue
 
         # Detect end of function (next @ctx.mcp.tool() or end of register function)
-        if in_function and ("def register_" in line or "@ctx.mcp.tool()" in line):
+        if in_function and (b"def register_" in line or b"@ctx.mcp.tool()" in line):
             in_function = False
             docstring_ended = False
 
         # Inside function body
         if in_function:
             # Check if we're past the docstring
-            if '"""' in line and docstring_ended is False:
-                if line.strip().endswith('"""') and line.strip() != '"""':
+            if b'"""' in line and docstring_ended is False:
+                if line.strip().endswith(b'"""') and line.strip() != b'"""':
                     docstring_ended = True
-                elif line.strip() == '"""':
+                elif line.strip() == b'"""':
                     # Check next few lines to see if docstring continues
                     j = i + 1
                     while j < min(i + 5, len(lines)):
-                        if '"""' in lines[j]:
+                        if b'"""' in lines[j]:
                             docstring_ended = True
                             break
                         j += 1
-            elif docstring_ended is False and line.strip().startswith('"""'):
+            elif docstring_ended is False and line.strip().startswith(b'"""'):
                 docstring_ended = True
 
             # Fix indentation: function body should be indented 8 spaces (2 levels)
             # But parameters and docstring are already correct
-            if docstring_ended and line.strip() and not line.strip().startswith("#"):
-                # Function body lines that start with 12 spaces should be 8 spaces
-                if line.startswith("            ") and not line.startswith(
-                    '            """'
-                ):
-                    fixed_lines.append("        " + line[12:])
-                # Lines with 16 spaces should be 12 spaces (nested blocks)
-                elif line.startswith("                "):
-                    fixed_lines.append("            " + line[16:])
-                # Lines with 20 spaces should be 16 spaces (double nested)
-                elif line.startswith("                    "):
-                    fixed_lines.append("                " + line[20:])
-                else:
-                    fixed_lines.append(line)
-            else:
-                fixed_lines.append(line)
-        else:
-            fixed_lines.append(line)
+            # Function body lines indented 12+ spaces move up one level (4 spaces);
+            # nested blocks keep their relative indentation
+            stripped = line.lstrip(b" ")
+            indent = len(line) - len(stripped)
+            if (
+                docstring_ended
+                and stripped.strip()
+                and not stripped.startswith(b"#")
+                and indent >= 12
+                and not (indent == 12 and stripped.startswith(b'"""'))
+            ):
+                lines[i] = b" " * (indent - 4) + stripped
 
         i += 1
 
-    file_path.write_text("\n".join(fixed_lines), encoding="utf-8")
-    print(f"Fixed {tool_file}")
+    new_content = b"".join(lines)
+    if new_content == original:
+        return f"Unchanged {tool_file}"
+    file_path.write_bytes(new_content)
+    return f"Fixed {tool_file}"
+
+
+if __name__ == "__main__":
+    existing = [tool_file for tool_file in tool_files if (TOOLS_DIR / tool_file).exists()]
+
+    # Files are independent; fix them across worker processes
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(fix_file, existing):
+            print(message)
 
-print("Done fixing indentation")
+    print("Done fixing indentation")
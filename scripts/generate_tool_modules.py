@@ -1,8 +1,10 @@
 """Generate tool modules from portmanteau_tools.py."""
 
-import re
+import mmap
 from pathlib import Path
 
+from _tool_codegen import MCP_TOOL_DECORATOR_RE, MODULE_HEADER, SELF_ATTR_RE, line_start, newline_offsets
+
 # Tool ranges from extract_tool_modules.py
 TOOL_RANGES = [
     ("tailscale_device", 93, 859),
@@ -21,74 +23,45 @@ TOOL_RANGES = [
 ]
 
 source_file = Path("src/tailscalemcp/tools/portmanteau_tools.py")
-content = source_file.read_text(encoding="utf-8")
-lines = content.split("\n")
+source = source_file.open("rb")
+mm = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
 
 # Skip funnel since it's already done
 tools_to_extract = [t for t in TOOL_RANGES if t[0] != "tailscale_funnel"]
 
+# Byte offsets of every newline, computed once; each range is sliced straight from the mapping
+newlines = newline_offsets(mm)
+
 for tool_name, start_line, end_line in tools_to_extract:
-    # Extract tool function (0-indexed)
-    tool_lines = lines[start_line - 1 : end_line]
-    tool_content = "\n".join(tool_lines)
+    # Extract tool function (lines start_line..end_line, 1-indexed) as a byte slice
+    start_pos = line_start(newlines, start_line - 1)
+    if start_pos is None:
+        tool_content = ""
+    else:
+        end_pos = line_start(newlines, end_line)
+        end_pos = len(mm) if end_pos is None else end_pos - 1
+        tool_content = mm[start_pos:end_pos].decode("utf-8")
 
     # Replace self. with ctx.
-    tool_content = tool_content.replace("self.mcp", "ctx.mcp")
-    tool_content = tool_content.replace("self.device_manager", "ctx.device_manager")
-    tool_content = tool_content.replace("self.monitor", "ctx.monitor")
-    tool_content = tool_content.replace(
-        "self.grafana_dashboard", "ctx.grafana_dashboard"
-    )
-    tool_content = tool_content.replace("self.taildrop_manager", "ctx.taildrop_manager")
-    tool_content = tool_content.replace(
-        "self.magic_dns_manager", "ctx.magic_dns_manager"
-    )
-    tool_content = tool_content.replace("self.funnel_manager", "ctx.funnel_manager")
-    tool_content = tool_content.replace("self.network_ops", "ctx.network_ops")
-    tool_content = tool_content.replace("self.policy_ops", "ctx.policy_ops")
-    tool_content = tool_content.replace("self.audit_ops", "ctx.audit_ops")
-    tool_content = tool_content.replace("self.tag_ops", "ctx.tag_ops")
-    tool_content = tool_content.replace("self.key_ops", "ctx.key_ops")
-    tool_content = tool_content.replace("self.policy_analyzer", "ctx.policy_analyzer")
-    tool_content = tool_content.replace("self.analytics_ops", "ctx.analytics_ops")
-    tool_content = tool_content.replace("self.reporting_ops", "ctx.reporting_ops")
-    tool_content = tool_content.replace("self.service_ops", "ctx.service_ops")
+    tool_content = SELF_ATTR_RE.sub(r"ctx.\1", tool_content)
 
     # Remove the @self.mcp.tool() decorator (will be added in register function)
-    tool_content = re.sub(
-        r"^\s*@self\.mcp\.tool\(\)\s*$", "", tool_content, flags=re.MULTILINE
-    )
+    tool_content = MCP_TOOL_DECORATOR_RE.sub("", tool_content)
 
     # Create module name
-    module_name = tool_name.replace("tailscale_", "") + "_tool"
+    slug = tool_name.replace("tailscale_", "")
+    module_name = slug + "_tool"
 
     # Generate module content
-    module_template = f'''"""Tailscale {tool_name.replace("tailscale_", "").replace("_", " ").title()} tool module."""
-
-from typing import Any
-
-import structlog
-
-from tailscalemcp.exceptions import TailscaleMCPError
-
-from ._base import ToolContext
-
-logger = structlog.get_logger(__name__)
-
-
-def register_{tool_name.replace("tailscale_", "")}_tool(ctx: ToolContext) -> None:
-    """Register the {tool_name} tool.
-
-    Args:
-        ctx: Tool context with all managers and MCP instance
-    """
-    @ctx.mcp.tool()
-{tool_content}
-'''
+    header = MODULE_HEADER.format(title=slug.replace("_", " ").title(), slug=slug, tool_name=tool_name)
+    module_template = header + tool_content + "\n"
 
     # Write module file
     output_file = Path(f"src/tailscalemcp/tools/{module_name}.py")
     output_file.write_text(module_template, encoding="utf-8")
     print(f"Generated {output_file}")
 
+mm.close()
+source.close()
+
 print(f"\nExtracted {len(tools_to_extract)} tool modules")
@@ -1,12 +1,28 @@
 """Rewrite all tool files from scratch with proper indentation."""
 
-import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from _tool_codegen import MCP_TOOL_DECORATOR_RE, MODULE_HEADER, SELF_ATTR_RE, SIG_END_RE
+
 # Read the backup file
 backup_file = Path("src/tailscalemcp/tools/portmanteau_tools.py.backup")
 content = backup_file.read_text(encoding="utf-8")
-lines = content.split("\n")
+lines = content.splitlines(keepends=True)
+
+# Index tool definitions and standalone docstring delimiters once for all tools
+ASYNC_DEF_LINES = [i for i, line in enumerate(lines) if "async def tailscale_" in line]
+TRIPLE_QUOTE_LINES = [i for i, line in enumerate(lines) if line.strip() == '"""']
+
+
+def first_at_or_after(positions, start, stop):
+    """Return the first indexed line in [start, stop), or None."""
+    idx = bisect_left(positions, start)
+    if idx < len(positions) and positions[idx] < stop:
+        return positions[idx]
+    return None
+
 
 # Tool ranges from earlier analysis
 TOOL_RANGES = [
@@ -28,34 +44,28 @@ TOOL_RANGES = [
 
 def extract_tool_function(lines, start_line, end_line):
     """Extract tool function and fix indentation."""
-    tool_lines = lines[start_line - 1 : end_line]
+    offset = start_line - 1
+    tool_lines = lines[offset:end_line]
 
     # Find the async def line
-    async_def_idx = None
-    for i, line in enumerate(tool_lines):
-        if "async def tailscale_" in line:
-            async_def_idx = i
-            break
-
-    if async_def_idx is None:
+    async_def_at = first_at_or_after(ASYNC_DEF_LINES, offset, offset + len(tool_lines))
+    if async_def_at is None:
         return None
+    async_def_idx = async_def_at - offset
 
-    # Extract function signature (from async def to closing paren)
+    # Extract function signature (from async def to the line closing it with the return annotation)
     func_sig_lines = []
-    paren_count = 0
     for i in range(async_def_idx, len(tool_lines)):
         line = tool_lines[i]
         func_sig_lines.append(line)
-        paren_count += line.count("(") - line.count(")")
-        if "-> dict[str, Any]:" in line and paren_count == 0:
+        if SIG_END_RE.search(line):
             break
 
     # Find docstring end
     docstring_end = len(func_sig_lines)
-    for i in range(len(func_sig_lines), len(tool_lines)):
-        if tool_lines[i].strip() == '"""':
-            docstring_end = i + 1
-            break
+    quote_at = first_at_or_after(TRIPLE_QUOTE_LINES, offset + len(func_sig_lines), offset + len(tool_lines))
+    if quote_at is not None:
+        docstring_end = quote_at - offset + 1
 
     # Extract function body
     body_lines = tool_lines[docstring_end:]
@@ -64,7 +74,7 @@ def extract_tool_function(lines, start_line, end_line):
     fixed_body = []
     for line in body_lines:
         if not line.strip():
-            fixed_body.append("")
+            fixed_body.append("\n")
             continue
 
         # Count current indentation
@@ -83,44 +93,24 @@ def extract_tool_function(lines, start_line, end_line):
     result = func_sig_lines + fixed_body
 
     # Replace self. with ctx.
-    result_text = "\n".join(result)
-    result_text = result_text.replace("self.mcp", "ctx.mcp")
-    result_text = result_text.replace("self.device_manager", "ctx.device_manager")
-    result_text = result_text.replace("self.monitor", "ctx.monitor")
-    result_text = result_text.replace("self.grafana_dashboard", "ctx.grafana_dashboard")
-    result_text = result_text.replace("self.taildrop_manager", "ctx.taildrop_manager")
-    result_text = result_text.replace("self.magic_dns_manager", "ctx.magic_dns_manager")
-    result_text = result_text.replace("self.funnel_manager", "ctx.funnel_manager")
-    result_text = result_text.replace("self.network_ops", "ctx.network_ops")
-    result_text = result_text.replace("self.policy_ops", "ctx.policy_ops")
-    result_text = result_text.replace("self.audit_ops", "ctx.audit_ops")
-    result_text = result_text.replace("self.tag_ops", "ctx.tag_ops")
-    result_text = result_text.replace("self.key_ops", "ctx.key_ops")
-    result_text = result_text.replace("self.policy_analyzer", "ctx.policy_analyzer")
-    result_text = result_text.replace("self.analytics_ops", "ctx.analytics_ops")
-    result_text = result_text.replace("self.reporting_ops", "ctx.reporting_ops")
-    result_text = result_text.replace("self.service_ops", "ctx.service_ops")
+    result_text = "".join(result)
+    result_text = SELF_ATTR_RE.sub(r"ctx.\1", result_text)
 
     # Remove @self.mcp.tool() decorator
-    result_text = re.sub(
-        r"^\s*@self\.mcp\.tool\(\)\s*$", "", result_text, flags=re.MULTILINE
-    )
-
-    return result_text.split("\n")
+    result_text = MCP_TOOL_DECORATOR_RE.sub("", result_text)
 
+    return result_text.splitlines(keepends=True)
 
-# Generate all tool files
-for tool_name, start_line, end_line in TOOL_RANGES:
-    if tool_name == "tailscale_funnel":
-        # Skip - already correct
-        continue
 
-    module_name = tool_name.replace("tailscale_", "") + "_tool"
+def generate_module(tool_range):
+    """Write the module for one TOOL_RANGES entry and return a status line."""
+    tool_name, start_line, end_line = tool_range
+    slug = tool_name.replace("tailscale_", "")
+    module_name = slug + "_tool"
     tool_func = extract_tool_function(lines, start_line, end_line)
 
     if tool_func is None:
-        print(f"Failed to extract {tool_name}")
-        continue
+        return f"Failed to extract {tool_name}"
 
     # Create module - properly indent the function
     # The tool_func lines need to be indented 4 spaces (under the decorator)
@@ -128,7 +118,7 @@ for tool_name, start_line, end_line in TOOL_RANGES:
     indented_func = []
     for _i, line in enumerate(tool_func):
         if not line.strip():
-            indented_func.append("")
+            indented_func.append("\n")
         elif line.strip().startswith("async def"):
             # async def should be at 4 spaces (same as decorator)
             indented_func.append("    " + line.lstrip())
@@ -136,31 +126,21 @@ for tool_name, start_line, end_line in TOOL_RANGES:
             # Other lines indented 4 spaces
             indented_func.append("    " + line)
 
-    module_content = f'''"""Tailscale {tool_name.replace("tailscale_", "").replace("_", " ").title()} tool module."""
-
-from typing import Any
-
-import structlog
-
-from tailscalemcp.exceptions import TailscaleMCPError
-
-from ._base import ToolContext
-
-logger = structlog.get_logger(__name__)
+    header = MODULE_HEADER.format(title=slug.replace("_", " ").title(), slug=slug, tool_name=tool_name)
+    module_content = header + "".join(indented_func)
 
+    output_file = Path(f"src/tailscalemcp/tools/{module_name}.py")
+    output_file.write_text(module_content, encoding="utf-8")
+    return f"Generated {module_name}.py"
 
-def register_{tool_name.replace("tailscale_", "")}_tool(ctx: ToolContext) -> None:
-    """Register the {tool_name} tool.
 
-    Args:
-        ctx: Tool context with all managers and MCP instance
-    """
-    @ctx.mcp.tool()
-{chr(10).join(indented_func)}
-'''
+if __name__ == "__main__":
+    # Skip funnel - already correct
+    tool_ranges = [t for t in TOOL_RANGES if t[0] != "tailscale_funnel"]
 
-    output_file = Path(f"src/tailscalemcp/tools/{module_name}.py")
-    output_file.write_text(module_content, encoding="utf-8")
-    print(f"Generated {module_name}.py")
+    # Each tool writes its own module; generate them across worker processes
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(generate_module, tool_ranges):
+            print(message)
 
-print("Done rewriting all tool files")
+    print("Done rewriting all tool files")
@@ -5,15 +5,29 @@ This module provides an MCP server for managing Tailscale networks,
 including device management, access control, and network monitoring.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any
 
 import structlog
 
 from .version import __version__
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 __author__ = "Sandra Schi <sandra@sandraschi.dev>"
 __license__ = "MIT"
 
@@ -21,6 +35,111 @@ __license__ = "MIT"
 _LOG_CONFIGURED = False
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """structlog serializer backed by orjson (handlers write text, hence the decode).
+
+    Like the stdlib path, unsupported objects fall back to structlog's handler (or str)
+    and non-str dict keys are stringified instead of raising inside logging.
+    """
+    return orjson.dumps(obj, default=kwargs.get("default") or str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# stdlib level for each BoundLogger method routed through _proxy_to_logger
+_METHOD_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+
+class LevelCheckedBoundLogger(structlog.stdlib.BoundLogger):
+    """stdlib BoundLogger that drops below-level calls before the processor chain runs.
+
+    The check is the stdlib logger's own cached isEnabledFor(), so it follows later
+    level changes (e.g. transport's ``--debug``) even for loggers structlog has
+    already cached.
+    """
+
+    def _proxy_to_logger(self, method_name: str, event: str | None = None, *event_args: str, **event_kw: Any) -> Any:
+        if not self._logger.isEnabledFor(_METHOD_LEVELS.get(method_name, logging.NOTSET)):
+            return None
+        return super()._proxy_to_logger(method_name, event, *event_args, **event_kw)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that coalesces writes in a userspace buffer.
+
+    The stock handler flushes (one write() syscall) after every record. Here records
+    accumulate in a 64 KiB buffer and are flushed on WARNING+ records, when
+    ``flush_interval`` seconds have passed since the last flush, or by one daemon
+    flusher thread that checks every ``flush_interval``, so a quiet log never sits in
+    the buffer. close() flushes the rest.
+    """
+
+    buffer_size = 64 * 1024
+
+    def __init__(self, *args: Any, flush_interval: float = 0.5, **kwargs: Any) -> None:
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._dirty = False
+        self._stop_flusher = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._size = 0
+        super().__init__(*args, **kwargs)
+
+    def _open(self) -> Any:
+        stream = open(
+            self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding, errors=self.errors
+        )
+        self._size = stream.seek(0, os.SEEK_END)
+        return stream
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            if self._dirty:
+                with self.lock:
+                    if self.stream is not None:
+                        self.stream.flush()
+                    self._dirty = False
+                    self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Size is tracked here, in encoded bytes like maxBytes; the base shouldRollover()
+            # calls stream.tell(), which would flush the buffer on every record
+            size = len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            now = time.monotonic()
+            if record.levelno >= logging.WARNING or now - self._last_flush >= self.flush_interval:
+                self.stream.flush()
+                self._dirty = False
+                self._last_flush = now
+            else:
+                self._dirty = True
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+                    self._flusher.start()
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        super().close()
+
+
 def setup_logging(log_level: str | None = None, log_file: str | None = None) -> None:
     """Configure structured logging once (idempotent).
 
@@ -36,23 +155,29 @@ def setup_logging(log_level: str | None = None, log_file: str | None = None) ->
 
     level = (log_level or os.getenv("LOG_LEVEL") or "INFO").upper()
 
-    processors = [
-        structlog.stdlib.filter_by_level,
+    # Below-level calls are dropped by LevelCheckedBoundLogger before any processor
+    # runs, so the chain has no filter_by_level step; stack rendering is DEBUG-only.
+    processors: list[Any] = [
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+    ]
+    if level == "DEBUG":
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors += [
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        if ORJSON_AVAILABLE
+        else structlog.processors.JSONRenderer(),
     ]
 
     structlog.configure(
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=LevelCheckedBoundLogger,
         cache_logger_on_first_use=True,
     )
 
@@ -62,13 +187,21 @@ def setup_logging(log_level: str | None = None, log_file: str | None = None) ->
     if log_file is None:
         log_file = os.getenv("LOG_FILE", "logs/tailscale-mcp.log")
     if log_file:
-        from logging.handlers import RotatingFileHandler
-
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")
+        file_handler = BufferedRotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8", delay=True
+        )
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        root_logger.addHandler(file_handler)
+
+        # File I/O happens on a listener thread; callers on the event loop only enqueue
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        # atexit runs in reverse order: drain the queue first, then flush and close the file
+        atexit.register(file_handler.close)
+        atexit.register(listener.stop)
+        root_logger.addHandler(QueueHandler(log_queue))
 
     if sys.stderr.encoding and sys.stderr.encoding.lower() in ("ascii", "ansi_x3.4-1968"):
         sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
@@ -43,7 +43,8 @@ def setup_structured_logging(log_level: str, log_file: str) -> None:
     level = (log_level or "INFO").upper()
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
-    file_handler = _logging.FileHandler(log_file)
+    # delay=True: the file is only opened when the first record is emitted
+    file_handler = _logging.FileHandler(log_file, delay=True, encoding="utf-8")
     file_handler.setFormatter(_logging.Formatter("%(message)s"))
 
     stderr_handler = _logging.StreamHandler(sys.stderr)
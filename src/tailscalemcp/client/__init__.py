@@ -1,7 +1,13 @@
 """Tailscale API client package."""
 
-from .api_client import TailscaleAPIClient
-from .rate_limiter import RateLimiter
+from .api_client import TailscaleAPIClient, shutdown_shared_clients
+from .rate_limiter import LeakyBucketRateLimiter, RateLimiter
 from .retry import RetryHandler
 
-__all__ = ["RateLimiter", "RetryHandler", "TailscaleAPIClient"]
+__all__ = [
+    "LeakyBucketRateLimiter",
+    "RateLimiter",
+    "RetryHandler",
+    "TailscaleAPIClient",
+    "shutdown_shared_clients",
+]
@@ -0,0 +1,30 @@
+"""
+Event-loop sleep helper for rate limiting and retry backoff.
+"""
+
+import asyncio
+import sys
+
+# Windows' default timer resolution is ~15.6 ms, so asyncio.sleep() there routinely
+# oversleeps short waits by up to a full tick; other platforms get sub-ms timers.
+_COARSE_TIMER = sys.platform == "win32"
+_TIMER_RESOLUTION = 0.016
+
+
+async def precise_sleep(delay: float) -> None:
+    """Sleep for ``delay`` seconds without the OS timer rounding it up.
+
+    On Windows the bulk of the wait is an ordinary asyncio.sleep() that stops one
+    timer tick early, and the remainder is spent yielding to the loop
+    (``asyncio.sleep(0)``) until the deadline; elsewhere this is asyncio.sleep().
+    """
+    if not _COARSE_TIMER:
+        await asyncio.sleep(delay)
+        return
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + delay
+    if delay > _TIMER_RESOLUTION:
+        await asyncio.sleep(delay - _TIMER_RESOLUTION)
+    while loop.time() < deadline:
+        await asyncio.sleep(0)
@@ -5,13 +5,21 @@ Provides comprehensive API integration with rate limiting, retry logic,
 and proper error handling.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import time
+import weakref
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
 import structlog
 
-from tailscalemcp.client.rate_limiter import RateLimiter
+from tailscalemcp.client.rate_limiter import LeakyBucketRateLimiter, RateLimiter
 from tailscalemcp.client.retry import RetryHandler
 from tailscalemcp.config import TailscaleConfig
 from tailscalemcp.exceptions import (
@@ -21,8 +29,208 @@ from tailscalemcp.exceptions import (
     TailscaleAPIError,
 )
 from tailscalemcp.models.service import Service
+from tailscalemcp.monitoring import API_REQUESTS
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = structlog.get_logger(__name__)
+# stdlib logger for the same name; isEnabledFor() is a cached level check used to skip
+# building debug records on the request hot path
+_stdlib_logger = logging.getLogger(__name__)
+
+
+# Pooled HTTP clients shared across TailscaleAPIClient instances, keyed by
+# (event loop, timeout, max_connections, max_keepalive_connections), with reference counts.
+# httpx connections belong to the loop that opened them, so each loop gets its own pool.
+_ClientKey = tuple[asyncio.AbstractEventLoop | None, float, int, int]
+_SHARED_CLIENTS: dict[_ClientKey, httpx.AsyncClient] = {}
+_SHARED_REFCOUNTS: dict[_ClientKey, int] = {}
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _acquire_shared_client(key: _ClientKey) -> httpx.AsyncClient:
+    """Return the shared client for these settings, creating it on first use."""
+    client = _SHARED_CLIENTS.get(key)
+    if client is None or client.is_closed:
+        _, timeout, max_connections, max_keepalive = key
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive,
+                max_connections=max_connections,
+            ),
+            http2=HTTP2_AVAILABLE,
+            headers={
+                "User-Agent": "tailscale-mcp/2.0.2",
+            },
+        )
+        _SHARED_CLIENTS[key] = client
+        _SHARED_REFCOUNTS[key] = 0
+    _SHARED_REFCOUNTS[key] += 1
+    return client
+
+
+def _forget_shared_client(key: _ClientKey) -> httpx.AsyncClient | None:
+    """Drop one reference to a shared client, returning it once it is unused."""
+    remaining = _SHARED_REFCOUNTS.get(key, 0) - 1
+    if remaining > 0:
+        _SHARED_REFCOUNTS[key] = remaining
+        return None
+    _SHARED_REFCOUNTS.pop(key, None)
+    return _SHARED_CLIENTS.pop(key, None)
+
+
+async def _release_shared_client(key: _ClientKey) -> None:
+    """Drop one reference to a shared client, closing it when unused."""
+    client = _forget_shared_client(key)
+    # A client bound to another (usually finished) loop can't be closed from this one
+    if client is not None and not client.is_closed and key[0] in (None, _running_loop()):
+        await client.aclose()
+
+
+async def shutdown_shared_clients() -> None:
+    """Close every shared HTTP client (call once at server shutdown)."""
+    loop = _running_loop()
+    clients = [client for key, client in _SHARED_CLIENTS.items() if key[0] in (None, loop)]
+    _SHARED_CLIENTS.clear()
+    _SHARED_REFCOUNTS.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
+
+
+# API request counts are aggregated here and pushed to the Prometheus counter at most
+# once per METRICS_FLUSH_INTERVAL, so the hot path never takes prometheus_client's locks.
+# A flush is also scheduled on the event loop after the first pending count, so the last
+# burst before an idle period still reaches /metrics.
+METRICS_FLUSH_INTERVAL = 1.0
+_pending_api_requests: Counter[tuple[str, str]] = Counter()
+_last_metrics_flush = time.monotonic()
+# Pending scheduled flush and the loop it was scheduled on
+_scheduled_flush: tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle] | None = None
+# Labelled counter children, created on first observation of each (resource, status)
+_api_request_children: dict[tuple[str, str], Any] = {}
+
+
+def _record_api_request(endpoint: str, status: str) -> None:
+    """Count one API request, flushing to Prometheus when the interval has elapsed."""
+    global _scheduled_flush
+    # Label by top-level resource ("devices", "acl", ...) to keep per-ID paths out of the label set
+    _pending_api_requests[(endpoint.strip("/").split("/", 1)[0], status)] += 1
+    if time.monotonic() - _last_metrics_flush >= METRICS_FLUSH_INTERVAL:
+        flush_api_request_metrics()
+        return
+    loop = asyncio.get_running_loop()
+    if _scheduled_flush is None or _scheduled_flush[0] is not loop:
+        _scheduled_flush = (loop, loop.call_later(METRICS_FLUSH_INTERVAL, flush_api_request_metrics))
+
+
+def flush_api_request_metrics() -> None:
+    """Push pending API request counts into the Prometheus counter."""
+    global _last_metrics_flush, _scheduled_flush
+    if _scheduled_flush is not None:
+        _scheduled_flush[1].cancel()
+        _scheduled_flush = None
+    _last_metrics_flush = time.monotonic()
+    pending = dict(_pending_api_requests)
+    _pending_api_requests.clear()
+    if API_REQUESTS is None:
+        return
+    for labels, count in pending.items():
+        child = _api_request_children.get(labels)
+        if child is None:
+            endpoint, status = labels
+            child = _api_request_children[labels] = API_REQUESTS.labels(endpoint=endpoint, status=status)
+        child.inc(count)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a JSON request body or cached response (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a JSON document (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Cached GET responses shared by every client in the process, keyed by
+# (tailnet API base URL, API key digest, endpoint, normalized query params), so clients
+# holding different credentials never see each other's responses. Entries hold the
+# serialized body so each hit hands the caller its own copy.
+_CacheKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+_RESPONSE_CACHE: dict[_CacheKey, tuple[float, bytes]] = {}
+# Single-flight locks per cache key; asyncio locks are loop-bound, so one table per loop
+_RESPONSE_CACHE_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_CacheKey, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+# Bound methods called whenever any client writes, so caches layered above a client
+# (e.g. the device manager's) also see writes made through other client instances
+_INVALIDATION_LISTENERS: list[weakref.WeakMethod[Callable[[], None]]] = []
+
+
+def add_invalidation_listener(callback: Callable[[], None]) -> None:
+    """Call ``callback`` after every write made through any TailscaleAPIClient.
+
+    Only a weak reference is kept, so registering does not keep the owner alive.
+
+    Args:
+        callback: Bound method taking no arguments (e.g. a manager's invalidate_cache)
+    """
+    _INVALIDATION_LISTENERS.append(weakref.WeakMethod(callback))
+
+
+def _notify_invalidation_listeners() -> None:
+    """Run the live invalidation listeners, pruning those whose owner is gone."""
+    alive = []
+    for ref in _INVALIDATION_LISTENERS:
+        callback = ref()
+        if callback is not None:
+            alive.append(ref)
+            callback()
+    _INVALIDATION_LISTENERS[:] = alive
+
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper so ijson can pull from an httpx byte stream."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        return await anext(self._chunks, b"")
 
 
 class TailscaleAPIClient:
@@ -30,6 +238,17 @@ class TailscaleAPIClient:
 
     BASE_URL = "https://api.tailscale.com"
 
+    # Upper bound on memoized endpoint URLs (per-device paths would otherwise grow unbounded)
+    MAX_CACHED_URLS = 256
+
+    # Read-mostly endpoints served from an in-process cache for this many seconds.
+    # Any non-GET request on the same tailnet invalidates that tailnet's entries.
+    CACHE_TTLS: dict[str, float] = {
+        "/devices": 10.0,
+        "/acl": 30.0,
+        "/dns/nameservers": 30.0,
+    }
+
     def __init__(
         self,
         config: TailscaleConfig | None = None,
@@ -51,7 +270,7 @@ class TailscaleAPIClient:
             self.base_url = config.api_base_url
         else:
             self.config = None
-            self.api_key = api_key or os.getenv("TAILSCALE_API_KEY")
+            self.api_key = api_key or os.getenv("TAILSCALE_API_KEY") or ""
             self.tailnet = tailnet or os.getenv("TAILSCALE_TAILNET")
             self.timeout = 30.0
             self.base_url = self.BASE_URL
@@ -78,10 +297,17 @@ class TailscaleAPIClient:
 
         # Initialize rate limiter and retry handler
         if self.config:
-            self.rate_limiter = RateLimiter(
-                rate=self.config.rate_limit_per_second,
-                window=self.config.rate_limit_window,
-            )
+            self.rate_limiter: RateLimiter | LeakyBucketRateLimiter
+            if self.config.rate_limit_algorithm == "leaky":
+                self.rate_limiter = LeakyBucketRateLimiter(
+                    drip_rate=self.config.rate_limit_per_second,
+                    burst=self.config.rate_limit_per_second * self.config.rate_limit_window,
+                )
+            else:
+                self.rate_limiter = RateLimiter(
+                    rate=self.config.rate_limit_per_second,
+                    window=self.config.rate_limit_window,
+                )
             self.retry_handler = RetryHandler(
                 max_retries=self.config.max_retries,
                 backoff_factor=self.config.retry_backoff_factor,
@@ -90,22 +316,16 @@ class TailscaleAPIClient:
             self.rate_limiter = RateLimiter()
             self.retry_handler = RetryHandler()
 
-        # HTTP client with connection pooling
+        # Long-lived HTTP client shared by every instance with the same settings, so TCP/TLS
+        # setup is paid once per process and keepalive connections are reused across calls
+        # (multiplexed over HTTP/2 when h2 is installed)
         max_connections = self.config.max_connections if self.config else 10
         max_keepalive = self.config.max_keepalive_connections if self.config else 5
+        self.max_connections = max_connections
 
-        limits = httpx.Limits(
-            max_keepalive_connections=max_keepalive,
-            max_connections=max_connections,
-        )
-
-        self.client = httpx.AsyncClient(
-            timeout=self.timeout,
-            limits=limits,
-            headers={
-                "User-Agent": "tailscale-mcp/2.0.2",
-            },
-        )
+        self._client_key: _ClientKey = (_running_loop(), self.timeout, max_connections, max_keepalive)
+        self._client = _acquire_shared_client(self._client_key)
+        self._closed = False
 
         logger.info(
             "Tailscale API client initialized",
@@ -113,11 +333,112 @@ class TailscaleAPIClient:
             base_url=self.api_base_url,
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for the running event loop."""
+        loop = _running_loop()
+        if loop is not None and self._client_key[0] is not loop:
+            # First use on this loop (or the instance was built outside one): switch pools
+            _forget_shared_client(self._client_key)
+            self._client_key = (loop, *self._client_key[1:])
+            self._client = _acquire_shared_client(self._client_key)
+        return self._client
+
+    @property
+    def api_key(self) -> str:
+        """Tailscale API key used for the Authorization header."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        # Rebuild the auth headers once here (including on credential hot-reload) instead
+        # of on every request
+        self._api_key = value
+        self._auth_headers = {
+            "Authorization": f"Bearer {value or ''}",
+            "Content-Type": "application/json",
+        }
+        # Identifies the credential in response cache keys without keeping the key itself there
+        self._credential_id = hashlib.sha256((value or "").encode()).hexdigest()
+
+    @property
+    def api_base_url(self) -> str:
+        """Tailnet-scoped API base URL."""
+        return self._api_base_url
+
+    @api_base_url.setter
+    def api_base_url(self, value: str) -> None:
+        self._api_base_url = value
+        self._urls: dict[str, str] = {}
+
+    def _url(self, endpoint: str) -> str:
+        """Return the absolute URL for an endpoint, memoized per base URL."""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = f"{self._api_base_url}/{endpoint.lstrip('/')}"
+            if len(self._urls) < self.MAX_CACHED_URLS:
+                self._urls[endpoint] = url
+        return url
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Make an authenticated request, serving cacheable GETs from the TTL cache.
+
+        Concurrent misses for the same key wait on one in-flight request instead of
+        each hitting the API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint (relative to tailnet URL)
+            **kwargs: Additional arguments for httpx request
+
+        Returns:
+            JSON response from the API
+        """
+        ttl = self.CACHE_TTLS.get(endpoint) if method == "GET" else None
+        if ttl is None:
+            try:
+                return await self._send(method, endpoint, **kwargs)
+            finally:
+                if method != "GET":
+                    self.invalidate_cache()
+                    _notify_invalidation_listeners()
+
+        params = kwargs.get("params") or {}
+        key = (
+            self.api_base_url,
+            self._credential_id,
+            endpoint,
+            tuple(sorted((str(k), str(v)) for k, v in params.items())),
+        )
+        entry = _RESPONSE_CACHE.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return _loads(entry[1])
+
+        locks = _RESPONSE_CACHE_LOCKS.setdefault(asyncio.get_running_loop(), {})
+        async with locks.setdefault(key, asyncio.Lock()):
+            entry = _RESPONSE_CACHE.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return _loads(entry[1])
+            result = await self._send(method, endpoint, **kwargs)
+            _RESPONSE_CACHE[key] = (time.monotonic(), _dumps(result))
+            return result
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached response for this client's tailnet."""
+        base_url = self.api_base_url
+        for key in [k for k in _RESPONSE_CACHE if k[0] == base_url]:
+            del _RESPONSE_CACHE[key]
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """Make an authenticated request to the Tailscale API with rate limiting and retry.
 
@@ -132,35 +453,35 @@ class TailscaleAPIClient:
         Raises:
             AuthenticationError: If authentication fails
             NotFoundError: If resource not found
-            RateLimitExceededError: If rate limit exceeded
+            RateLimitExceededError: If the rate limit is still exceeded after retries
             TailscaleAPIError: If API request fails
         """
-        url = f"{self.api_base_url}/{endpoint.lstrip('/')}"
+        url = self._url(endpoint)
 
         if not self.api_key:
             raise AuthenticationError("Tailscale API key not configured — set TAILSCALE_API_KEY in Settings or .env")
         if not self.tailnet:
             raise AuthenticationError("Tailnet not configured — set TAILSCALE_TAILNET in Settings or .env")
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        headers.update(kwargs.pop("headers", {}))
+        # The pooled client is shared across credentials, so auth goes on each request;
+        # the prebuilt dict is reused unless the caller passes overrides
+        extra_headers = kwargs.pop("headers", None)
+        headers = {**self._auth_headers, **extra_headers} if extra_headers else self._auth_headers
+
+        # Serialize the body once, outside the retry loop, so every attempt reuses the bytes
+        if "json" in kwargs:
+            kwargs["content"] = _dumps(kwargs.pop("json"))
 
         async def _make_request() -> dict[str, Any]:
             """Inner function for retry logic."""
             await self.rate_limiter.acquire()
 
             try:
-                logger.debug(
-                    "Making API request",
-                    method=method,
-                    url=url,
-                    endpoint=endpoint,
-                )
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Making API request", method=method, endpoint=endpoint)
 
                 response = await self.client.request(method, url, headers=headers, **kwargs)
+                _record_api_request(endpoint, str(response.status_code))
 
                 # Handle specific status codes
                 if response.status_code == 401:
@@ -168,7 +489,10 @@ class TailscaleAPIClient:
                 elif response.status_code == 404:
                     raise NotFoundError("Resource", endpoint)
                 elif response.status_code == 429:
-                    raise RateLimitExceededError("Rate limit exceeded")
+                    # Chain the status error so the retry handler sees the 429 and its Retry-After
+                    raise RateLimitExceededError("Rate limit exceeded") from httpx.HTTPStatusError(
+                        "Rate limit exceeded", request=response.request, response=response
+                    )
 
                 response.raise_for_status()
 
@@ -176,6 +500,8 @@ class TailscaleAPIClient:
                 if response.status_code == 204:
                     return {}
 
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(response.content)
                 return response.json()
 
             except httpx.HTTPStatusError as e:
@@ -190,21 +516,29 @@ class TailscaleAPIClient:
                     f"API request failed: {e.response.status_code} - {e.response.text[:200]}"
                 ) from e
             except (httpx.RequestError, httpx.TimeoutException) as e:
+                _record_api_request(endpoint, "error")
                 logger.error("Network error during API request", error=str(e))
                 raise TailscaleAPIError(f"Network error: {e!s}") from e
 
         try:
             return await self.retry_handler.execute(_make_request)
         except (AuthenticationError, NotFoundError, RateLimitExceededError):
-            # Don't retry auth/not found/rate limit errors
+            # Surface auth/not found/rate limit errors as-is once retries are done
             raise
         except Exception as e:
             logger.error("Unexpected error during API request", error=str(e))
             raise TailscaleAPIError(f"Unexpected error: {e!s}") from e
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release this instance's reference to the shared HTTP client.
+
+        The underlying connection pool is closed once its last user releases it.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        flush_api_request_metrics()
+        await _release_shared_client(self._client_key)
 
     async def __aenter__(self) -> "TailscaleAPIClient":
         """Async context manager entry."""
@@ -226,6 +560,72 @@ class TailscaleAPIClient:
         logger.info("Devices retrieved from API", count=len(devices))
         return devices
 
+    async def iter_devices(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield devices in the tailnet as they are parsed off the wire.
+
+        With ijson installed (the ``streaming`` extra) the response is parsed
+        incrementally, so memory stays flat on large tailnets and callers can start work
+        before the download finishes. Without it this falls back to list_devices().
+
+        Opening the stream goes through the rate limiter and retry handler like any other
+        request; once devices have been yielded, a dropped connection is not retried.
+
+        Yields:
+            Device information dictionaries
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitExceededError: If the rate limit is still exceeded after retries
+            TailscaleAPIError: If the API request fails
+        """
+        if not IJSON_AVAILABLE:
+            for device in await self.list_devices():
+                yield device
+            return
+
+        if not self.api_key or not self.tailnet:
+            raise AuthenticationError("Tailscale API key or tailnet not configured")
+
+        async def _open_stream() -> httpx.Response:
+            """Send the request and check its status, leaving the body unread."""
+            await self.rate_limiter.acquire()
+            request = self.client.build_request("GET", self._url("/devices"), headers=self._auth_headers)
+            response = await self.client.send(request, stream=True)
+            _record_api_request("/devices", str(response.status_code))
+            if not response.is_error:
+                return response
+
+            await response.aread()
+            await response.aclose()
+            error = httpx.HTTPStatusError(
+                f"API request failed: {response.status_code}", request=request, response=response
+            )
+            if response.status_code == 401:
+                raise AuthenticationError("Invalid API key or authentication failed")
+            if response.status_code == 429:
+                raise RateLimitExceededError("Rate limit exceeded") from error
+            raise TailscaleAPIError(f"API request failed: {response.status_code} - {response.text[:200]}") from error
+
+        try:
+            response = await self.retry_handler.execute(_open_stream)
+        except (httpx.RequestError, httpx.TimeoutException) as e:
+            _record_api_request("/devices", "error")
+            logger.error("Network error during device stream", error=str(e))
+            raise TailscaleAPIError(f"Network error: {e!s}") from e
+
+        count = 0
+        try:
+            async for device in ijson.items_async(_AsyncByteReader(response), "devices.item", use_float=True):
+                count += 1
+                yield device
+        except (httpx.RequestError, httpx.TimeoutException) as e:
+            logger.error("Network error during device stream", error=str(e))
+            raise TailscaleAPIError(f"Network error: {e!s}") from e
+        finally:
+            await response.aclose()
+
+        logger.info("Devices streamed from API", count=count)
+
     async def get_device(self, device_id: str) -> dict[str, Any]:
         """Get details for a specific device.
 
@@ -239,6 +639,30 @@ class TailscaleAPIClient:
         logger.info("Device retrieved from API", device_id=device_id)
         return response
 
+    async def get_devices_bulk(
+        self,
+        device_ids: list[str],
+        concurrency: int | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get details for several devices concurrently.
+
+        Args:
+            device_ids: Device IDs or stable IDs
+            concurrency: Max in-flight requests (default: connection pool size)
+
+        Returns:
+            One entry per ID, in order: the device dictionary or the exception raised for it
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_connections)
+
+        async def _get_one(device_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_device(device_id)
+
+        results = await asyncio.gather(*(_get_one(device_id) for device_id in device_ids), return_exceptions=True)
+        logger.info("Devices retrieved in bulk", requested=len(device_ids))
+        return results
+
     async def update_device(self, device_id: str, updates: dict[str, Any]) -> dict[str, Any]:
         """Update a device (e.g., rename, tags, authorized status).
 
@@ -319,7 +743,7 @@ class TailscaleAPIClient:
         """
         data = await self._request("GET", "/services")
         raw_services = data.get("services", []) if isinstance(data, dict) else data
-        services: list[Service] = [Service.from_api_response(s) for s in (raw_services or [])]
+        services = Service.list_from_api_response(raw_services or [])
         logger.info("Services retrieved from API", count=len(services))
         return services
 
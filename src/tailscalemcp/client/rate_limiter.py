@@ -6,17 +6,38 @@ Implements token bucket algorithm to respect API rate limits.
 
 import asyncio
 import time
-from collections import deque
 from typing import Any
 
 import structlog
 
+from tailscalemcp.client._timing import precise_sleep
+
 logger = structlog.get_logger(__name__)
 
+# Bound once; same clock as loop.time() on the default event loops
+_mono = time.monotonic
+
+
+class _LoopClockMixin:
+    """Reads time from the running event loop's clock, caching the loop in ``_loop``."""
+
+    __slots__ = ()
+
+    _loop: asyncio.AbstractEventLoop | None
 
-class RateLimiter:
+    def _loop_time(self) -> float:
+        """Event loop clock (monotonic; the same basis asyncio.sleep schedules against)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._loop = asyncio.get_running_loop()
+        return loop.time()
+
+
+class RateLimiter(_LoopClockMixin):
     """Token bucket rate limiter for API requests."""
 
+    __slots__ = ("_loop", "capacity", "last_refill", "rate", "tokens", "window")
+
     def __init__(
         self,
         rate: float = 1.0,
@@ -25,68 +46,139 @@ class RateLimiter:
         """Initialize rate limiter.
 
         Args:
-            rate: Requests per second allowed
-            window: Time window in seconds for tracking
+            rate: Requests per second allowed (bucket refill rate)
+            window: Time window in seconds; the bucket holds rate * window tokens
         """
         self.rate = rate
         self.window = window
-        self.min_interval = 1.0 / rate if rate > 0 else 0
-        self._last_request_time = 0.0
-        self._request_times: deque[float] = deque(maxlen=int(rate * window))
-        self._lock = asyncio.Lock()
+        self.capacity = max(rate * window, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = _mono()
+        self._loop = None
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill, capped at capacity."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
 
     async def acquire(self) -> None:
         """Acquire permission to make a request.
 
-        Waits if necessary to respect rate limits.
+        Waits if necessary to respect rate limits. The token is reserved first (the
+        count may go negative) and the caller then sleeps until its slot, so
+        concurrent callers queue up for consecutive slots instead of serializing
+        behind one sleeper.
         """
-        async with self._lock:
-            current_time = time.monotonic()
-
-            # Remove old requests outside the window
-            cutoff_time = current_time - self.window
-            while self._request_times and self._request_times[0] < cutoff_time:
-                self._request_times.popleft()
-
-            # Check if we're at the rate limit
-            if len(self._request_times) >= int(self.rate * self.window):
-                # Wait until oldest request is outside the window
-                wait_time = self._request_times[0] + self.window - current_time
-                if wait_time > 0:
-                    logger.debug(
-                        "Rate limit reached, waiting",
-                        wait_time=wait_time,
-                        rate=self.rate,
-                    )
-                    await asyncio.sleep(wait_time)
-                    current_time = time.monotonic()
-
-            # Ensure minimum interval between requests
-            time_since_last = current_time - self._last_request_time
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                logger.debug("Enforcing minimum interval", sleep_time=sleep_time)
-                await asyncio.sleep(sleep_time)
-                current_time = time.monotonic()
-
-            # Record this request
-            self._last_request_time = current_time
-            self._request_times.append(current_time)
+        if self.rate <= 0:
+            return
+
+        # No await between reading and updating the bucket, so the reservation is
+        # atomic on the event loop without a lock; callers are served in call order
+        self._refill(self._loop_time())
+        self.tokens -= 1
+        wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait_time > 0:
+            logger.debug(
+                "Rate limit reached, waiting",
+                wait_time=wait_time,
+                rate=self.rate,
+            )
+            try:
+                await precise_sleep(wait_time)
+            except asyncio.CancelledError:
+                # Give the reserved token back so later callers are not delayed for it
+                self.tokens += 1
+                raise
 
     def get_stats(self) -> dict[str, Any]:
         """Get current rate limiter statistics.
 
+        Computed from the bucket state in constant time.
+
         Returns:
             Dictionary with rate limit stats
         """
-        current_time = time.monotonic()
-        cutoff_time = current_time - self.window
-        recent_requests = [req_time for req_time in self._request_times if req_time >= cutoff_time]
+        tokens = min(self.capacity, self.tokens + (_mono() - self.last_refill) * self.rate)
 
         return {
             "rate": self.rate,
             "window": self.window,
-            "requests_in_window": len(recent_requests),
-            "max_requests": int(self.rate * self.window),
-            "min_interval": self.min_interval,
+            "requests_in_window": int(self.capacity - tokens),
+            "max_requests": int(self.capacity),
+            "tokens_available": max(0.0, tokens),
+            "capacity": self.capacity,
+        }
+
+
+class LeakyBucketRateLimiter(_LoopClockMixin):
+    """Leaky bucket rate limiter for API requests.
+
+    Each request adds one unit to the bucket, which drains at ``drip_rate`` per
+    second. Requests that would overflow ``burst`` wait until enough has drained,
+    which keeps outbound traffic at a steady rate once the burst allowance is used.
+    """
+
+    __slots__ = ("_loop", "capacity", "drip_rate", "last_leak", "level")
+
+    def __init__(
+        self,
+        drip_rate: float = 1.0,
+        burst: float = 60.0,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            drip_rate: Sustained requests per second
+            burst: Bucket capacity (requests allowed back-to-back)
+        """
+        self.drip_rate = drip_rate
+        self.capacity = max(burst, 1.0)
+        self.level = 0.0
+        self.last_leak = _mono()
+        self._loop = None
+
+    def _leak(self, now: float) -> None:
+        """Drain the bucket for the time elapsed since the last leak."""
+        self.level = max(0.0, self.level - (now - self.last_leak) * self.drip_rate)
+        self.last_leak = now
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request.
+
+        Waits if the bucket is full; the slot is reserved before waiting.
+        """
+        if self.drip_rate <= 0:
+            return
+
+        self._leak(self._loop_time())
+        self.level += 1
+        wait_time = (self.level - self.capacity) / self.drip_rate if self.level > self.capacity else 0.0
+
+        if wait_time > 0:
+            logger.debug(
+                "Rate limit reached, waiting",
+                wait_time=wait_time,
+                rate=self.drip_rate,
+            )
+            try:
+                await precise_sleep(wait_time)
+            except asyncio.CancelledError:
+                self.level -= 1
+                raise
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get current rate limiter statistics.
+
+        Returns:
+            Dictionary with rate limit stats
+        """
+        level = max(0.0, self.level - (_mono() - self.last_leak) * self.drip_rate)
+
+        return {
+            "rate": self.drip_rate,
+            "burst": self.capacity,
+            "level": level,
+            "tokens_available": max(0.0, self.capacity - level),
+            "capacity": self.capacity,
         }
@@ -5,75 +5,130 @@ Retry handler with exponential backoff for API requests.
 import asyncio
 import random
 from collections.abc import Callable
-from typing import Any, TypeVar
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, TypeVar
 
 import httpx
 import structlog
 
+from tailscalemcp.client._timing import precise_sleep
+
 logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+JitterMode = Literal["none", "full", "decorrelated"]
+
+MAX_DELAY = 60.0
+
 
 class RetryHandler:
     """Handler for retrying failed API requests with exponential backoff."""
 
+    __slots__ = ("_base_delays", "backoff_factor", "jitter", "max_retries")
+
+    # Network errors and timeouts are always retried (httpx.TimeoutException is a RequestError)
+    _RETRY_TYPES: tuple[type[BaseException], ...] = (httpx.RequestError, asyncio.TimeoutError)
+    # Rate limit, server errors, and gateway errors
+    _RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+    # The only statuses retried when the API client wrapped the httpx error: the server
+    # rejected the request without processing it, so re-sending a POST/PATCH/PUT cannot
+    # create duplicates. Wrapped 5xx and network errors are ambiguous and not retried.
+    _WRAPPED_RETRY_STATUS = frozenset({429, 503})
+
     def __init__(
         self,
         max_retries: int = 3,
         backoff_factor: float = 2.0,
-        jitter: bool = True,
+        jitter: bool | JitterMode = True,
     ) -> None:
         """Initialize retry handler.
 
         Args:
             max_retries: Maximum number of retry attempts
-            backoff_factor: Exponential backoff multiplier
-            jitter: Add random jitter to backoff delay
+            backoff_factor: Exponential backoff multiplier (also the minimum decorrelated delay)
+            jitter: "decorrelated" (default, also True), "full", or "none" (also False)
         """
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
-        self.jitter = jitter
+        if isinstance(jitter, bool):
+            jitter = "decorrelated" if jitter else "none"
+        self.jitter: JitterMode = jitter
+        # Base delay per attempt is fixed for the handler's lifetime; capped at MAX_DELAY
+        self._base_delays = tuple(min(backoff_factor**attempt, MAX_DELAY) for attempt in range(max_retries + 1))
+
+    @staticmethod
+    def _http_error(error: BaseException) -> BaseException:
+        """Return the underlying httpx error when the client wrapped it (raise ... from e)."""
+        cause = error.__cause__
+        return cause if isinstance(cause, httpx.HTTPError) else error
+
+    def _retry_after(self, error: BaseException) -> float | None:
+        """Seconds the server asked us to wait via Retry-After, if it said so.
+
+        Args:
+            error: The exception that occurred
 
-    def _should_retry(self, error: Exception) -> bool:
+        Returns:
+            Delay in seconds, or None when there is no usable Retry-After header
+        """
+        error = self._http_error(error)
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        value = error.response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+    def _should_retry(self, error: BaseException) -> bool:
         """Determine if an error should be retried.
 
+        Errors the API client wrapped in its own exception types are retried only for
+        a 429 or 503 they were raised from, which is safe for any HTTP method.
+
         Args:
             error: The exception that occurred
 
         Returns:
             True if the error should be retried
         """
-        # Retry on network errors and 5xx status codes
-        if isinstance(error, httpx.RequestError):
-            return True
-
-        # Retry on rate limit (429)
         if isinstance(error, httpx.HTTPStatusError):
-            status_code = error.response.status_code
-            # Retry on rate limit, server errors, and gateway errors
-            return status_code in (429, 500, 502, 503, 504)
-
-        # Retry on timeout
-        return isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError))
+            return error.response.status_code in self._RETRY_STATUS
+        if isinstance(error, self._RETRY_TYPES):
+            return True
+        cause = error.__cause__
+        return isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code in self._WRAPPED_RETRY_STATUS
 
-    def _get_delay(self, attempt: int) -> float:
+    def _get_delay(self, attempt: int, prev_delay: float) -> float:
         """Calculate delay for retry attempt.
 
+        Decorrelated jitter draws from [backoff_factor, 3 * prev_delay], so retries from
+        many clients spread out instead of re-synchronizing; full jitter draws from
+        [0, exponential base].
+
         Args:
             attempt: Retry attempt number (0-based)
+            prev_delay: Delay used before the previous attempt (backoff_factor initially)
 
         Returns:
             Delay in seconds
         """
-        delay = self.backoff_factor**attempt
-
-        if self.jitter:
-            # Add random jitter (0-25% of delay)
-            jitter_amount = delay * 0.25 * random.random()  # noqa: S311
-            delay += jitter_amount
-
-        return min(delay, 60.0)  # Cap at 60 seconds
+        if self.jitter == "decorrelated":
+            return min(MAX_DELAY, random.uniform(self.backoff_factor, prev_delay * 3.0))  # noqa: S311
+        if self.jitter == "full":
+            return random.uniform(0, self._base_delays[attempt])  # noqa: S311
+        return self._base_delays[attempt]
 
     async def execute(
         self,
@@ -95,10 +150,13 @@ class RetryHandler:
             Exception: Last exception if all retries fail
         """
         last_error: Exception | None = None
+        delay = self.backoff_factor
+        # Whether func is a coroutine function can't change between attempts; check it once
+        is_coroutine = asyncio.iscoroutinefunction(func)
 
         for attempt in range(self.max_retries + 1):
             try:
-                if asyncio.iscoroutinefunction(func):
+                if is_coroutine:
                     return await func(*args, **kwargs)
                 return func(*args, **kwargs)
 
@@ -116,7 +174,12 @@ class RetryHandler:
                     raise
 
                 # Calculate delay and wait
-                delay = self._get_delay(attempt)
+                retry_after = self._retry_after(e)
+                if retry_after is not None:
+                    # Honor the server's Retry-After (429/503), with a little jitter
+                    delay = min(MAX_DELAY, retry_after) + random.uniform(0, 0.25)  # noqa: S311
+                else:
+                    delay = self._get_delay(attempt, delay)
                 logger.warning(
                     "Request failed, retrying",
                     error=str(e),
@@ -125,7 +188,7 @@ class RetryHandler:
                     delay=delay,
                 )
 
-                await asyncio.sleep(delay)
+                await precise_sleep(delay)
 
         # Should never reach here, but satisfy type checker
         if last_error:
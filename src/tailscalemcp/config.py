@@ -4,20 +4,33 @@ Configuration management for Tailscale MCP.
 Handles environment variables, settings, and secure credential storage.
 """
 
-import os
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
-from pydantic import Field
+from pydantic import Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load .env file if it exists
-env_path = Path(__file__).parent.parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-else:
-    # Also try loading from current directory
-    load_dotenv()
+_dotenv_loaded = False
+
+
+def ensure_dotenv_loaded() -> None:
+    """Load the .env file into the environment, once per process.
+
+    Not run when this module is imported; entry points and modules that read the
+    environment at import time call it first.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    env_path = Path(__file__).parent.parent.parent / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
+    else:
+        # Also try loading from current directory
+        load_dotenv()
 
 
 class TailscaleConfig(BaseSettings):
@@ -42,6 +55,10 @@ class TailscaleConfig(BaseSettings):
     # Rate limiting
     rate_limit_per_second: float = Field(default=1.0, description="API requests per second limit")
     rate_limit_window: int = Field(default=60, description="Rate limit window in seconds")
+    rate_limit_algorithm: Literal["token", "leaky"] = Field(
+        default="token",
+        description="Rate limiter: token bucket (bursts up to rate * window) or leaky bucket (smoothed)",
+    )
 
     # Retry configuration
     max_retries: int = Field(default=3, description="Maximum retry attempts")
@@ -64,28 +81,32 @@ class TailscaleConfig(BaseSettings):
     def from_env(cls) -> "TailscaleConfig":
         """Load configuration from environment variables.
 
+        All fields are read by pydantic-settings (environment, then ``.env``).
+
         Returns:
             TailscaleConfig instance
 
         Raises:
             ValueError: If required settings are missing
         """
-        api_key = os.getenv("TAILSCALE_API_KEY")
-        tailnet = os.getenv("TAILSCALE_TAILNET")
-
-        if not api_key:
-            raise ValueError("TAILSCALE_API_KEY environment variable is required. Set it in .env file or environment.")
-
-        if not tailnet:
-            raise ValueError("TAILSCALE_TAILNET environment variable is required. Set it in .env file or environment.")
-
-        return cls(
-            tailscale_api_key=api_key,
-            tailscale_tailnet=tailnet,
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            api_timeout=float(os.getenv("API_TIMEOUT", "30.0")),
-            prometheus_port=int(os.getenv("PROMETHEUS_PORT", "9091")),
-        )
+        ensure_dotenv_loaded()
+        required = (("tailscale_api_key", "TAILSCALE_API_KEY"), ("tailscale_tailnet", "TAILSCALE_TAILNET"))
+        try:
+            config = cls()
+        except ValidationError as e:
+            missing = {err["loc"][0] for err in e.errors() if err["type"] == "missing"}
+            for field, env_var in required:
+                if field in missing:
+                    raise ValueError(
+                        f"{env_var} environment variable is required. Set it in .env file or environment."
+                    ) from e
+            raise
+
+        for field, env_var in required:
+            if not getattr(config, field):
+                raise ValueError(f"{env_var} environment variable is required. Set it in .env file or environment.")
+
+        return config
 
 
 def get_config() -> TailscaleConfig:
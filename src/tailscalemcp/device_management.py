@@ -5,24 +5,107 @@ Provides comprehensive device management capabilities including authorization,
 SSH access, device tagging, and advanced configuration management.
 """
 
+import asyncio
 import os
 import time
-from typing import Any
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any, Final, NamedTuple, TypeVar
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .config import TailscaleConfig
-from .exceptions import TailscaleMCPError
-from .models.device import DeviceStatus
+from .client.api_client import add_invalidation_listener
+from .config import TailscaleConfig, ensure_dotenv_loaded
+from .exceptions import AuthenticationError, AuthorizationError, NotFoundError, TailscaleMCPError
+from .models.device import Device, DeviceStatus
 from .operations.devices import DeviceOperations
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Enum members are singletons, so status checks can compare identity against this
+_ONLINE: Final = DeviceStatus.ONLINE
+
+
+# The module-level settings below may come from .env
+ensure_dotenv_loaded()
+
+
+def _parse_float_env(name: str, default: float) -> float:
+    """Read a float from the environment, falling back to the default if unset or invalid."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _parse_int_env(name: str, default: int) -> int:
+    """Read an int from the environment, falling back to the default if unset or invalid."""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Seconds since last seen before a device counts as offline.
+# Default: 1 hour - balances catching offline devices with reasonable active time
+_ONLINE_TIMEOUT_SECONDS = _parse_int_env("TAILSCALE_ONLINE_TIMEOUT_SECONDS", 3600)
+
+# Max device updates in flight at once for the bulk methods
+_MAX_CONCURRENT_UPDATES = max(_parse_int_env("TAILSCALE_MAX_CONCURRENT_UPDATES", 8), 1)
+
+# Cache lifetimes in seconds: device lookups and lists are kept briefly (normal policy),
+# aggregated statistics tolerate more staleness (long policy)
+CACHE_TTL_GET = _parse_float_env("TAILSCALE_CACHE_TTL_GET", 10.0)
+CACHE_TTL_LIST = _parse_float_env("TAILSCALE_CACHE_TTL_LIST", 15.0)
+CACHE_TTL_STATS = _parse_float_env("TAILSCALE_CACHE_TTL_STATS", 45.0)
+# Oldest result (seconds since it was fetched) that may be served when a refresh fails
+CACHE_MAX_STALE = _parse_float_env("TAILSCALE_CACHE_MAX_STALE", 300.0)
+
+
+def _is_auth_failure(error: BaseException | None) -> bool:
+    """Whether an error, or any error it was raised from, is an API 401/403."""
+    while error is not None:
+        if isinstance(error, (AuthenticationError, AuthorizationError)):
+            return True
+        if getattr(getattr(error, "response", None), "status_code", None) in (401, 403):
+            return True
+        error = error.__cause__
+    return False
+
+
+class _CacheEntry(NamedTuple):
+    """A cached API result and its freshness window (``time.monotonic`` based)."""
+
+    value: Any
+    generated_at: float
+    stale_at: float
+
+
+# Fields search_devices can match, in the order they are stored in the search corpus
+_SEARCH_FIELDS = ("name", "hostname", "tags", "os")
+
+
+class _DeviceSnapshot(NamedTuple):
+    """One fetch of the tailnet's devices plus indexes derived from it."""
+
+    raw: list[dict[str, Any]]
+    devices: list[Device]
+    # tag -> IDs of devices carrying it
+    tag_index: dict[str, set[str]]
+    # Per device (same order as devices): casefolded _SEARCH_FIELDS values, tags NUL-joined
+    search_corpus: list[tuple[str, ...]]
+    # device ID -> last_seen as a POSIX timestamp (devices never seen are absent)
+    last_seen_ts: dict[str, float]
+
 
 class DeviceInfo(BaseModel):
     """Device information model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     device_id: str = Field(..., description="Unique device identifier")
     name: str = Field(..., description="Device name")
     hostname: str = Field(..., description="Device hostname")
@@ -42,6 +125,8 @@ class DeviceInfo(BaseModel):
 class SSHKey(BaseModel):
     """SSH key information model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     key_id: str = Field(..., description="SSH key identifier")
     public_key: str = Field(..., description="Public key content")
     device_id: str = Field(..., description="Associated device ID")
@@ -53,6 +138,8 @@ class SSHKey(BaseModel):
 class DeviceTag(BaseModel):
     """Device tag model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     tag: str = Field(..., description="Tag name")
     devices: list[str] = Field(default_factory=list, description="Device IDs with this tag")
     created_at: float = Field(..., description="Tag creation timestamp")
@@ -62,6 +149,8 @@ class DeviceTag(BaseModel):
 class AdvancedDeviceManager:
     """Advanced device management with comprehensive features."""
 
+    online_timeout_seconds: int
+
     def __init__(self, api_key: str | None = None, tailnet: str | None = None):
         """Initialize advanced device manager.
 
@@ -75,6 +164,10 @@ class AdvancedDeviceManager:
         self.ssh_keys: dict[str, SSHKey] = {}
         self.device_tags: dict[str, DeviceTag] = {}
         self.device_groups: dict[str, list[str]] = {}
+        # Last good API results; kept past their TTL so they can be served if the API fails
+        self._cache: dict[tuple[Any, ...], _CacheEntry] = {}
+        # Refreshes in progress, so concurrent callers for one key share a single API call
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
 
         # Initialize operations layer for real Tailscale API calls
         config = TailscaleConfig(
@@ -83,19 +176,172 @@ class AdvancedDeviceManager:
         )
         self.device_operations = DeviceOperations(config=config)
 
-        # Reuse the client from device_operations to avoid duplicate connections
+        # Same client instance as device_operations (one connection pool); used directly for the
+        # users endpoints and for updates whose callers expect the raw API response
         self.api_client = self.device_operations.client
+        # Writes made through any other client (tools, operations modules) also clear the cache
+        add_invalidation_listener(self.invalidate_cache)
 
         # Configurable timeout for determining if a device is online
-        # Default: 1 hour - balances catching offline devices with reasonable active time
-        self.online_timeout_seconds = os.getenv("TAILSCALE_ONLINE_TIMEOUT_SECONDS", "3600")
-        try:
-            self.online_timeout_seconds = int(self.online_timeout_seconds)
-        except ValueError:
-            self.online_timeout_seconds = 3600  # Default to 1 hour
+        self.online_timeout_seconds = _ONLINE_TIMEOUT_SECONDS
+
+        # Bounds concurrent updates issued by the bulk methods
+        self._update_sem = asyncio.Semaphore(_MAX_CONCURRENT_UPDATES)
 
         logger.info("Advanced device manager initialized", tailnet=tailnet)
 
+    async def _cached(self, key: tuple[Any, ...], ttl: float, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return a cached result, calling ``loader`` when it is missing or expired.
+
+        Concurrent callers for the same key wait on one in-flight load instead of
+        each calling the API. If the loader fails and an earlier result no older than
+        CACHE_MAX_STALE exists, that (stale) result is returned instead of the error.
+        NotFoundError and authentication/authorization failures are never masked.
+
+        Args:
+            key: Cache key
+            ttl: Seconds a fresh result may be served without calling the loader
+            loader: Coroutine function producing the result
+
+        Returns:
+            Cached or freshly loaded result
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry.stale_at:
+            return entry.value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._refresh(key, ttl, loader, entry))
+
+            def forget(done: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        # Shielded so one caller being cancelled does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _refresh(
+        self,
+        key: tuple[Any, ...],
+        ttl: float,
+        loader: Callable[[], Awaitable[T]],
+        entry: _CacheEntry | None,
+    ) -> T:
+        """Run ``loader`` and store its result, falling back to ``entry`` on failure."""
+        now = time.monotonic()
+        try:
+            value = await loader()
+        except NotFoundError:
+            self._cache.pop(key, None)
+            raise
+        except Exception as e:
+            if _is_auth_failure(e):
+                # The credentials no longer grant access; don't keep serving what they fetched
+                self._cache.pop(key, None)
+                raise
+            if entry is None or now - entry.generated_at > CACHE_MAX_STALE:
+                raise
+            logger.warning(
+                "Serving stale cached result after API error",
+                key=key,
+                age=now - entry.generated_at,
+                error=str(e),
+            )
+            return entry.value
+
+        # Not stored if invalidate_cache ran while this load was in flight
+        if self._inflight.get(key) is asyncio.current_task():
+            self._cache[key] = _CacheEntry(value, now, now + ttl)
+        return value
+
+    async def _device_snapshot(self) -> _DeviceSnapshot:
+        """Fetch the full device list once per TTL window.
+
+        Returns:
+            Raw API device dicts, the matching Device models and indexes derived from them
+        """
+
+        async def load() -> _DeviceSnapshot:
+            raw = await self.device_operations.list_devices_raw()
+            previous = self._cache.get(("devices",))
+            if previous is not None and previous.value.raw == raw:
+                # Unchanged since the last fetch: keep the parsed models and indexes
+                return previous.value
+
+            devices = [Device.from_api_response(d) for d in raw]
+            tag_index: dict[str, set[str]] = {}
+            search_corpus: list[tuple[str, ...]] = []
+            last_seen_ts: dict[str, float] = {}
+            for device in devices:
+                if device.last_seen:
+                    last_seen_ts[device.id] = device.last_seen.timestamp()
+                for tag in device.tags:
+                    tag_index.setdefault(tag, set()).add(device.id)
+                search_corpus.append(
+                    (
+                        device.name.casefold(),
+                        device.hostname.casefold(),
+                        "\0".join(device.tags).casefold(),
+                        device.os.casefold(),
+                    )
+                )
+            return _DeviceSnapshot(raw, devices, tag_index, search_corpus, last_seen_ts)
+
+        return await self._cached(("devices",), CACHE_TTL_LIST, load)
+
+    def _device_to_dict(
+        self,
+        device: Device,
+        current_time: float,
+        last_seen_ts: float | None,
+        online_status: DeviceStatus = _ONLINE,
+    ) -> dict[str, Any]:
+        """Convert a Device model to the dict format expected by tools.
+
+        Args:
+            device: Device model
+            current_time: Timestamp used for devices never seen and for time_since_seen
+            last_seen_ts: Precomputed ``device.last_seen.timestamp()``, None if never seen
+            online_status: Status that counts as online
+
+        Returns:
+            Device information dictionary
+        """
+        status = device.status
+        device_id = device.id
+        addrs = [a for a in (device.ipv4, device.ipv6) if a]
+        return {
+            "id": device_id,
+            "device_id": device_id,
+            "name": device.name,
+            "hostname": device.hostname,
+            "os": device.os,
+            "ip_addresses": addrs,
+            "addresses": addrs,
+            "status": status.value,
+            "online": status is online_status,
+            "last_seen": current_time if last_seen_ts is None else last_seen_ts,
+            "time_since_seen": None if last_seen_ts is None else current_time - last_seen_ts,
+            "authorized": device.authorized,
+            "tags": device.tags,
+            "ssh_enabled": False,  # Would need separate API call
+            "is_exit_node": False,  # Extract from API if available
+            "is_subnet_router": False,  # Extract from API if available
+            "advertised_routes": [],  # Extract from API if available
+            "client_version": device.client_version or "unknown",
+            "user": device.user or "",
+            "machine_key": device.machine_key or "",
+            "update_available": False,  # Would need separate API call
+        }
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached device results (called after any device update)."""
+        self._cache.clear()
+        # Loads already in flight may predate the update; later callers start a new one
+        self._inflight.clear()
+
     # -----------------------
     # Supported Admin API endpoints
     # -----------------------
@@ -145,7 +391,11 @@ class AdvancedDeviceManager:
         """
         try:
             # Use operations layer
-            device = await self.device_operations.get_device(device_id)
+            device: Device = await self._cached(
+                ("get", device_id),
+                CACHE_TTL_GET,
+                lambda: self.device_operations.get_device(device_id),
+            )
 
             # Convert to dict format expected by tools
             return {
@@ -187,6 +437,7 @@ class AdvancedDeviceManager:
             if advertise_routes is not None:
                 payload["routes"] = advertise_routes
             result = await self.api_client.update_device(device_id, payload)
+            self.invalidate_cache()
             logger.info("Exit node enabled", device_id=device_id, routes=advertise_routes)
             return {"device_id": device_id, "result": result}
         except Exception as e:
@@ -197,6 +448,7 @@ class AdvancedDeviceManager:
         """Disable exit node on a device."""
         try:
             result = await self.api_client.update_device(device_id, {"isExitNode": False})
+            self.invalidate_cache()
             logger.info("Exit node disabled", device_id=device_id)
             return {"device_id": device_id, "result": result}
         except Exception as e:
@@ -207,6 +459,7 @@ class AdvancedDeviceManager:
         """Enable subnet routing by advertising routes on a device."""
         try:
             result = await self.api_client.update_device(device_id, {"routes": subnets})
+            self.invalidate_cache()
             logger.info("Subnet router enabled", device_id=device_id, subnets=subnets)
             return {"device_id": device_id, "result": result}
         except Exception as e:
@@ -217,6 +470,7 @@ class AdvancedDeviceManager:
         """Disable subnet routing by clearing advertised routes."""
         try:
             result = await self.api_client.update_device(device_id, {"routes": []})
+            self.invalidate_cache()
             logger.info("Subnet router disabled", device_id=device_id)
             return {"device_id": device_id, "result": result}
         except Exception as e:
@@ -239,6 +493,7 @@ class AdvancedDeviceManager:
         try:
             # Use operations layer
             device = await self.device_operations.authorize_device(device_id, authorize, reason)
+            self.invalidate_cache()
 
             logger.info(
                 "Device authorization updated",
@@ -259,6 +514,75 @@ class AdvancedDeviceManager:
             logger.error("Error updating device authorization", error=str(e))
             raise TailscaleMCPError(f"Failed to update device authorization: {e}") from e
 
+    async def _bounded_update(self, device_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Update one device, waiting for a free slot in the bulk update semaphore."""
+        async with self._update_sem:
+            return await self.api_client.update_device(device_id, payload)
+
+    async def _bulk_update(self, action: str, device_ids: list[str], payload: dict[str, Any]) -> list[dict[str, Any]]:
+        """Apply the same update to several devices concurrently.
+
+        Args:
+            action: Name of the operation, for logging
+            device_ids: Device IDs to update
+            payload: Update applied to every device
+
+        Returns:
+            One status dict per device ID, in order
+        """
+        results = await asyncio.gather(
+            *(self._bounded_update(device_id, payload) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        self.invalidate_cache()
+
+        statuses: list[dict[str, Any]] = []
+        for device_id, result in zip(device_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                statuses.append({"device_id": device_id, "success": False, "error": str(result)})
+            else:
+                statuses.append({"device_id": device_id, "success": True, "result": result})
+
+        failed = sum(1 for status in statuses if not status["success"])
+        logger.info("Bulk device update", action=action, requested=len(device_ids), failed=failed)
+        return statuses
+
+    async def authorize_devices(self, device_ids: list[str], authorize: bool = True) -> list[dict[str, Any]]:
+        """Authorize or revoke several devices concurrently.
+
+        Args:
+            device_ids: Device IDs to authorize/revoke
+            authorize: Whether to authorize (True) or revoke (False)
+
+        Returns:
+            Per-device status dicts (device_id, success, and result or error)
+        """
+        return await self._bulk_update("authorize", device_ids, {"authorized": authorize})
+
+    async def set_exit_nodes(self, device_ids: list[str], enabled: bool) -> list[dict[str, Any]]:
+        """Enable or disable exit node on several devices concurrently.
+
+        Args:
+            device_ids: Device IDs to update
+            enabled: Whether the devices should act as exit nodes
+
+        Returns:
+            Per-device status dicts (device_id, success, and result or error)
+        """
+        return await self._bulk_update("set_exit_nodes", device_ids, {"isExitNode": enabled})
+
+    async def set_routes(self, device_ids: list[str], routes: list[str]) -> list[dict[str, Any]]:
+        """Set advertised routes on several devices concurrently (empty list clears them).
+
+        Args:
+            device_ids: Device IDs to update
+            routes: Routes to advertise
+
+        Returns:
+            Per-device status dicts (device_id, success, and result or error)
+        """
+        return await self._bulk_update("set_routes", device_ids, {"routes": routes})
+
     async def rename_device(self, device_id: str, new_name: str, update_hostname: bool = False) -> dict[str, Any]:
         """Rename a device.
 
@@ -273,6 +597,7 @@ class AdvancedDeviceManager:
         try:
             # Use operations layer
             device = await self.device_operations.rename_device(device_id, new_name)
+            self.invalidate_cache()
 
             logger.info(
                 "Device renamed",
@@ -307,6 +632,7 @@ class AdvancedDeviceManager:
         try:
             # Use operations layer
             device = await self.device_operations.tag_device(device_id, tags, operation)
+            self.invalidate_cache()
 
             logger.info(
                 "Device tags updated",
@@ -342,48 +668,23 @@ class AdvancedDeviceManager:
             List of device information from real Tailscale API
         """
         try:
-            # Use operations layer
-            devices = await self.device_operations.list_devices(
-                online_only=online_only,
-                filter_tags=filter_tags or [],
-            )
+            # Filter the shared device list locally
+            snapshot = await self._device_snapshot()
+            devices = snapshot.devices
+            if filter_tags:
+                # Devices must carry every requested tag: intersect the tags' posting sets
+                empty: set[str] = set()
+                matching_ids = set.intersection(*(snapshot.tag_index.get(tag, empty) for tag in filter_tags))
+                devices = [d for d in devices if d.id in matching_ids]
+            if online_only:
+                devices = [d for d in devices if d.status is _ONLINE]
 
             # Convert Device models to dict format expected by tools
-            devices_list = []
             current_time = time.time()
+            seen = snapshot.last_seen_ts
+            devices_list = [self._device_to_dict(device, current_time, seen.get(device.id)) for device in devices]
 
-            for device in devices:
-                # Convert Device model to dict
-                last_seen_ts = device.last_seen.timestamp() if device.last_seen else current_time
-                is_online = device.status == DeviceStatus.ONLINE
-
-                addrs = [a for a in (device.ipv4, device.ipv6) if a]
-                device_data = {
-                    "id": device.id,
-                    "device_id": device.id,
-                    "name": device.name,
-                    "hostname": device.hostname,
-                    "os": device.os,
-                    "ip_addresses": addrs,
-                    "addresses": addrs,
-                    "status": device.status.value,
-                    "online": is_online,
-                    "last_seen": last_seen_ts,
-                    "time_since_seen": current_time - last_seen_ts if device.last_seen else None,
-                    "authorized": device.authorized,
-                    "tags": device.tags,
-                    "ssh_enabled": False,  # Would need separate API call
-                    "is_exit_node": False,  # Extract from API if available
-                    "is_subnet_router": False,  # Extract from API if available
-                    "advertised_routes": [],  # Extract from API if available
-                    "client_version": device.client_version or "unknown",
-                    "user": device.user or "",
-                    "machine_key": device.machine_key or "",
-                    "update_available": False,  # Would need separate API call
-                }
-                devices_list.append(device_data)
-
-            logger.info(
+            logger.debug(
                 "Devices listed from real API",
                 total_devices=len(devices_list),
                 online_only=online_only,
@@ -397,7 +698,7 @@ class AdvancedDeviceManager:
             raise TailscaleMCPError(f"Failed to list devices: {e}") from e
 
     async def list_devices_by_tag(self, tag: str) -> list[dict[str, Any]]:
-        """List devices with a specific tag using live API filter.
+        """List devices with a specific tag (filtered locally over the cached device list).
 
         Args:
             tag: Tag to filter by
@@ -407,7 +708,7 @@ class AdvancedDeviceManager:
         """
         try:
             devices = await self.list_devices(online_only=False, filter_tags=[tag])
-            logger.info("Devices listed by tag", tag=tag, device_count=len(devices))
+            logger.debug("Devices listed by tag", tag=tag, device_count=len(devices))
             return devices
 
         except Exception as e:
@@ -428,13 +729,12 @@ class AdvancedDeviceManager:
             Group creation result
         """
         try:
-            # Validate device IDs
-            valid_devices = []
-            for device_id in device_ids:
-                if device_id in self.devices:
-                    valid_devices.append(device_id)
-                else:
-                    logger.warning("Invalid device ID in group", device_id=device_id)
+            # Validate device IDs; unknown ones are reported in a single log record
+            known = self.devices.keys()
+            valid_devices = [d for d in device_ids if d in known]
+            if len(valid_devices) != len(device_ids):
+                invalid = [d for d in device_ids if d not in known]
+                logger.warning("Invalid device IDs in group", count=len(invalid), sample=invalid[:10])
 
             self.device_groups[group_name] = valid_devices
 
@@ -461,55 +761,61 @@ class AdvancedDeviceManager:
     async def get_device_statistics(self) -> dict[str, Any]:
         """Get comprehensive device statistics.
 
+        The summary is cached under the long TTL policy (TAILSCALE_CACHE_TTL_STATS).
+
         Returns:
             Device statistics summary
         """
         try:
-            api_devices = await self.api_client.list_devices()
-            total_devices = len(api_devices)
-
-            authorized_devices = sum(1 for d in api_devices if d.get("authorized", True))
-            connected = sum(1 for d in api_devices if d.get("connectedToControl", False))
-            exit_nodes = sum(1 for d in api_devices if d.get("isExitNode", False))
-            subnet_routers = sum(1 for d in api_devices if len(d.get("routes", [])) > 0)
-
-            # OS distribution
-            os_distribution: dict[str, int] = {}
-            for d in api_devices:
-                os_name = d.get("os", "unknown")
-                os_distribution[os_name] = os_distribution.get(os_name, 0) + 1
-
-            # Tag usage
-            tag_usage: dict[str, int] = {}
-            for d in api_devices:
-                for tag in d.get("tags", []) or []:
-                    tag_usage[tag] = tag_usage.get(tag, 0) + 1
-
-            # Client version distribution
-            version_distribution: dict[str, int] = {}
-            for d in api_devices:
-                ver = d.get("clientVersion", "unknown")
-                version_distribution[ver] = version_distribution.get(ver, 0) + 1
-
-            return {
-                "total_devices": total_devices,
-                "authorized_devices": authorized_devices,
-                "online_devices": connected,
-                "exit_nodes": exit_nodes,
-                "subnet_routers": subnet_routers,
-                "authorization_rate": (authorized_devices / total_devices * 100) if total_devices else 0,
-                "uptime_percentage": (connected / total_devices * 100) if total_devices else 0,
-                "os_distribution": os_distribution,
-                "tag_usage": tag_usage,
-                "version_distribution": version_distribution,
-            }
+            stats = await self._cached(("stats", self.tailnet), CACHE_TTL_STATS, self._compute_device_statistics)
+            return dict(stats)
 
         except Exception as e:
             logger.error("Error getting device statistics", error=str(e))
             raise TailscaleMCPError(f"Failed to get device statistics: {e}") from e
 
+    async def _compute_device_statistics(self) -> dict[str, Any]:
+        """Aggregate device statistics over the cached device list."""
+        api_devices = (await self._device_snapshot()).raw
+        total_devices = len(api_devices)
+
+        # Single pass over the devices for all counts and distributions
+        authorized_devices = connected = exit_nodes = subnet_routers = 0
+        os_distribution: Counter[str] = Counter()
+        tag_usage: Counter[str] = Counter()
+        version_distribution: Counter[str] = Counter()
+        for d in api_devices:
+            get = d.get
+            if get("authorized", True):
+                authorized_devices += 1
+            if get("connectedToControl", False):
+                connected += 1
+            if get("isExitNode", False):
+                exit_nodes += 1
+            if get("routes"):
+                subnet_routers += 1
+            os_distribution[get("os", "unknown")] += 1
+            tag_usage.update(get("tags") or ())
+            version_distribution[get("clientVersion", "unknown")] += 1
+
+        # One guarded division; both rates are 0 for an empty tailnet
+        inv_total = 100.0 / total_devices if total_devices else 0.0
+
+        return {
+            "total_devices": total_devices,
+            "authorized_devices": authorized_devices,
+            "online_devices": connected,
+            "exit_nodes": exit_nodes,
+            "subnet_routers": subnet_routers,
+            "authorization_rate": authorized_devices * inv_total,
+            "uptime_percentage": connected * inv_total,
+            "os_distribution": dict(os_distribution),
+            "tag_usage": dict(tag_usage),
+            "version_distribution": dict(version_distribution),
+        }
+
     async def search_devices(self, query: str, search_fields: list[str] | None = None) -> list[dict[str, Any]]:
-        """Search devices by various fields using live API list + filter.
+        """Search devices by various fields (case-insensitive substring match over the cached device list).
 
         Args:
             query: Search query
@@ -519,32 +825,23 @@ class AdvancedDeviceManager:
             List of matching devices
         """
         try:
-            # Use operations layer
-            devices = await self.device_operations.search_devices(query, search_fields)
+            fields = set(search_fields) if search_fields is not None else {"name", "hostname", "tags"}
+            columns = [i for i, field in enumerate(_SEARCH_FIELDS) if field in fields]
+            needle = query.casefold()
+
+            snapshot = await self._device_snapshot()
+            devices = [
+                device
+                for device, corpus in zip(snapshot.devices, snapshot.search_corpus, strict=True)
+                if any(needle in corpus[i] for i in columns)
+            ]
 
             # Convert Device models to dict format
-            results: list[dict[str, Any]] = []
             current_time = time.time()
+            seen = snapshot.last_seen_ts
+            results = [self._device_to_dict(device, current_time, seen.get(device.id)) for device in devices]
 
-            for device in devices:
-                last_seen_ts = device.last_seen.timestamp() if device.last_seen else current_time
-                is_online = device.status == DeviceStatus.ONLINE
-
-                device_dict = {
-                    "device_id": device.id,
-                    "name": device.name,
-                    "hostname": device.hostname,
-                    "os": device.os,
-                    "tags": device.tags,
-                    "status": device.status.value,
-                    "online": is_online,
-                    "last_seen": last_seen_ts,
-                    "authorized": device.authorized,
-                    "ip_addresses": [device.ipv4] if device.ipv4 else [],
-                }
-                results.append(device_dict)
-
-            logger.info(
+            logger.debug(
                 "Devices searched",
                 query=query,
                 search_fields=search_fields,
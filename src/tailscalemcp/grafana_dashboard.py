@@ -5,7 +5,10 @@ Provides comprehensive Grafana dashboard templates and configuration
 for visualizing Tailscale network metrics and health.
 """
 
+import asyncio
 import json
+import zipfile
+from pathlib import Path
 from typing import Any
 
 import structlog
@@ -13,9 +16,37 @@ from pydantic import BaseModel, Field
 
 from .exceptions import TailscaleMCPError
 
+# orjson is optional; serializes dashboard dicts several times faster than stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
 
+def _dump_json_bytes(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def dump_json(path: str | Path, obj: Any) -> None:
+    """Write an object as indented JSON to ``path`` in a single write."""
+    Path(path).write_bytes(_dump_json_bytes(obj))
+
+
+def _write_dashboard_archive(dashboards: dict[str, dict[str, Any]], filename: str) -> None:
+    """Write dashboards into one deflate-compressed zip, one JSON member each."""
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for member_name, dashboard_config in dashboards.items():
+            archive.writestr(member_name, _dump_json_bytes(dashboard_config))
+
+
 class GrafanaPanel(BaseModel):
     """Grafana panel configuration."""
 
@@ -759,8 +790,22 @@ class TailscaleGrafanaDashboard:
     def export_dashboard_json(self, dashboard_config: dict[str, Any], filename: str) -> None:
         """Export dashboard configuration to JSON file."""
         try:
-            with open(filename, "w") as f:
-                json.dump(dashboard_config, f, indent=2)
+            dump_json(filename, dashboard_config)
+
+            logger.info("Dashboard exported to JSON", filename=filename)
+
+        except Exception as e:
+            logger.error("Error exporting dashboard", filename=filename, error=str(e))
+            raise TailscaleMCPError(f"Failed to export dashboard: {e}") from e
+
+    async def export_dashboard(self, dashboard_config: dict[str, Any], filename: str) -> None:
+        """Export dashboard configuration to JSON file without blocking the event loop.
+
+        Serialization happens in memory; the file write runs in a worker thread.
+        """
+        try:
+            data = _dump_json_bytes(dashboard_config)
+            await asyncio.to_thread(Path(filename).write_bytes, data)
 
             logger.info("Dashboard exported to JSON", filename=filename)
 
@@ -768,6 +813,22 @@ class TailscaleGrafanaDashboard:
             logger.error("Error exporting dashboard", filename=filename, error=str(e))
             raise TailscaleMCPError(f"Failed to export dashboard: {e}") from e
 
+    async def export_dashboard_archive(self, dashboards: dict[str, dict[str, Any]], filename: str) -> None:
+        """Export several dashboards into a single zip archive.
+
+        Args:
+            dashboards: Archive member name (e.g. ``tailscale_topology_dashboard.json``) to dashboard configuration
+            filename: Path of the zip file to write
+        """
+        try:
+            await asyncio.to_thread(_write_dashboard_archive, dashboards, filename)
+
+            logger.info("Dashboards exported to archive", filename=filename, dashboards=len(dashboards))
+
+        except Exception as e:
+            logger.error("Error exporting dashboard archive", filename=filename, error=str(e))
+            raise TailscaleMCPError(f"Failed to export dashboard archive: {e}") from e
+
     def get_dashboard_summary(self, dashboard_config: dict[str, Any]) -> dict[str, Any]:
         """Get dashboard configuration summary."""
         dashboard = dashboard_config.get("dashboard", {})
@@ -14,7 +14,6 @@ from pathlib import Path
 from typing import Any
 
 import structlog
-from dotenv import load_dotenv
 from fastmcp import FastMCP
 from fastmcp.server import create_proxy
 
@@ -27,6 +26,12 @@ except ImportError:
     DISK_STORE_AVAILABLE = False
     DiskStore = None
 
+from .config import ensure_dotenv_loaded
+
+# Load .env before the imports below: several modules read settings at import time
+ensure_dotenv_loaded()
+
+from .client.api_client import shutdown_shared_clients
 from .device_management import AdvancedDeviceManager
 from .funnel import FunnelManager
 from .grafana_dashboard import TailscaleGrafanaDashboard
@@ -43,14 +48,6 @@ _USE_CLIENT_SAMPLING = os.getenv("TAILSCALE_SAMPLING_USE_CLIENT_LLM", "").lower(
     "yes",
 )
 
-# Load .env file if it exists (after imports to avoid E402)
-env_path = Path(__file__).parent.parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-else:
-    # Also try loading from current directory
-    load_dotenv()
-
 # Initialize logging (idempotent)
 from . import setup_logging
 
@@ -122,6 +119,9 @@ def create_server_lifespan(_api_key: str | None, tailnet: str | None):
         except Exception as e:
             logger.debug("State save skipped", error=str(e))
 
+        # Close the pooled HTTP connections shared by every API client
+        await shutdown_shared_clients()
+
     return server_lifespan
 
 
@@ -288,6 +288,8 @@ class TailscaleMCPServer:
         _patch(self.device_manager)
         _patch(self.device_manager.api_client)
         _patch(self.device_manager.device_operations.client)
+        # Cached device data belongs to the previous credentials/tailnet
+        self.device_manager.invalidate_cache()
 
         # Portmanteau tools config + ctx client
         _patch(self.portmanteau_tools.config)
@@ -7,6 +7,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+_fromisoformat = datetime.fromisoformat
+
 
 class DeviceStatus(StrEnum):
     """Device connection status."""
@@ -58,17 +60,16 @@ class Device(BaseModel):
                 return str(s) if s is not None else ""
             return s.replace("\u2014", "-").replace("\u2013", "-")
 
-        # Handle lastSeen timestamp
+        # Handle timestamps (fromisoformat accepts the API's trailing "Z" directly)
         last_seen = None
         if data.get("lastSeen"):
-            with contextlib.suppress(ValueError, AttributeError):
-                last_seen = datetime.fromisoformat(data["lastSeen"].replace("Z", "+00:00"))
+            with contextlib.suppress(ValueError, TypeError):
+                last_seen = _fromisoformat(data["lastSeen"])
 
-        # Handle expires timestamp
         expires = None
         if data.get("expires"):
-            with contextlib.suppress(ValueError, AttributeError):
-                expires = datetime.fromisoformat(data["expires"].replace("Z", "+00:00"))
+            with contextlib.suppress(ValueError, TypeError):
+                expires = _fromisoformat(data["expires"])
 
         v4, v6 = cls._parse_ip_addresses(data.get("addresses"))
 
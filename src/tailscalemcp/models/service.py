@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ServiceEndpoint(BaseModel):
@@ -34,28 +34,12 @@ class Service(BaseModel):
 
         The exact wire format may evolve; fields are mapped defensively.
         """
-        endpoints: list[ServiceEndpoint] = []
-        for ep in data.get("endpoints", []) or []:
-            endpoints.append(
-                ServiceEndpoint(
-                    device_id=ep.get("deviceId") or ep.get("device_id", ""),
-                    ip=ep.get("ip"),
-                    port=int(ep.get("port", 0)),
-                    protocol=(ep.get("protocol") or "tcp").lower(),
-                )
-            )
-
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", data.get("serviceName", "")),
-            tailvip_ipv4=data.get("tailvipIPv4") or data.get("tailvip_ipv4"),
-            tailvip_ipv6=data.get("tailvipIPv6") or data.get("tailvip_ipv6"),
-            magicdns_name=data.get("magicDNS") or data.get("magicdns_name"),
-            created_at=None,
-            updated_at=None,
-            tags=data.get("tags", []) or [],
-            endpoints=endpoints,
-        )
+        return cls.model_validate(_service_fields(data))
+
+    @classmethod
+    def list_from_api_response(cls, raw_services: list[dict[str, Any]]) -> list["Service"]:
+        """Create Services from a list API response in a single validation pass."""
+        return _SERVICE_LIST_ADAPTER.validate_python([_service_fields(s) for s in raw_services])
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize service to API-friendly dictionary."""
@@ -76,3 +60,28 @@ class Service(BaseModel):
                 for ep in self.endpoints
             ],
         }
+
+
+def _service_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Map an API service payload (camelCase or snake_case) onto Service field names."""
+    return {
+        "id": data.get("id", ""),
+        "name": data.get("name", data.get("serviceName", "")),
+        "tailvip_ipv4": data.get("tailvipIPv4") or data.get("tailvip_ipv4"),
+        "tailvip_ipv6": data.get("tailvipIPv6") or data.get("tailvip_ipv6"),
+        "magicdns_name": data.get("magicDNS") or data.get("magicdns_name"),
+        "tags": data.get("tags", []) or [],
+        "endpoints": [
+            {
+                "device_id": ep.get("deviceId") or ep.get("device_id", ""),
+                "ip": ep.get("ip"),
+                "port": int(ep.get("port", 0)),
+                "protocol": (ep.get("protocol") or "tcp").lower(),
+            }
+            for ep in data.get("endpoints", []) or []
+        ],
+    }
+
+
+# Built once; validates whole service lists in pydantic-core instead of per-object Python calls
+_SERVICE_LIST_ADAPTER = TypeAdapter(list[Service])
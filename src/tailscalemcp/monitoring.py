@@ -49,6 +49,16 @@ except ValueError:
     SUBNET_ROUTES = None
     TAILNET_INFO = None
 
+# Labelled children resolved once; updates then skip the per-call label lookup
+DEVICE_COUNT_BY_STATUS = (
+    {status: DEVICE_COUNT.labels(status=status) for status in ("online", "offline")} if DEVICE_COUNT is not None else {}
+)
+
+
+# Sentinel API keys (the .env.example placeholder and the demo key) that can never
+# authenticate; skip the Admin API round trip entirely when one is configured.
+PLACEHOLDER_API_KEYS = frozenset({"your_tailscale_api_key_here", "demo_key"})
+
 
 class NetworkMetrics(BaseModel):
     """Network metrics data model."""
@@ -101,15 +111,15 @@ class TailscaleMonitor:
         try:
             current_time = time.time()
 
-            # Collect device data (this would be replaced with actual API calls)
+            # Only the device fetch does I/O; the ACL rule count is still a placeholder
             devices = await self._get_devices_data()
+            acl_rules = await self._get_acl_rules_count()
             online_devices = [d for d in devices if d.get("status") == "online"]
             offline_devices = [d for d in devices if d.get("status") == "offline"]
 
             # Collect network statistics
             exit_nodes = len([d for d in devices if d.get("is_exit_node", False)])
             subnet_routes = len([d for d in devices if d.get("advertised_routes", [])])
-            acl_rules = await self._get_acl_rules_count()
 
             # Calculate network health score
             health_score = self._calculate_health_score(devices, online_devices)
@@ -333,8 +343,8 @@ class TailscaleMonitor:
                     "health_trend": self._calculate_trend([m.network_health_score for m in recent_metrics]),
                     "device_trend": self._calculate_trend([m.devices_online for m in recent_metrics]),
                 },
-                "alerts": await self._generate_alerts(metrics),
-                "recommendations": await self._generate_recommendations(metrics),
+                "alerts": self._generate_alerts(metrics),
+                "recommendations": self._generate_recommendations(metrics),
                 "timestamp": time.time(),
             }
 
@@ -351,6 +361,10 @@ class TailscaleMonitor:
 
     async def _get_devices_data(self) -> list[dict[str, Any]]:
         """Get devices data from real Tailscale API."""
+        if not self.api_key or self.api_key in PLACEHOLDER_API_KEYS:
+            logger.debug("No usable Tailscale API key configured, skipping device fetch")
+            return []
+
         try:
             from .operations.devices import DeviceOperations
 
@@ -360,7 +374,11 @@ class TailscaleMonitor:
                 tailscale_tailnet=self.tailnet or "",
             )
             device_ops = DeviceOperations(config=config)
-            devices_model = await device_ops.list_devices()
+            try:
+                devices_model = await device_ops.list_devices()
+            finally:
+                # Release this call's reference to the shared HTTP client
+                await device_ops.close()
 
             # Convert Device models to dict format for backward compatibility
             devices = [d.to_dict() if hasattr(d, "to_dict") else d.model_dump() for d in devices_model]
@@ -405,9 +423,9 @@ class TailscaleMonitor:
 
     async def _update_prometheus_metrics(self, metrics: NetworkMetrics, devices: list[dict[str, Any]]) -> None:
         """Update Prometheus metrics."""
-        if DEVICE_COUNT is not None:
-            DEVICE_COUNT.labels(status="online").set(metrics.devices_online)
-            DEVICE_COUNT.labels(status="offline").set(metrics.devices_offline)
+        if DEVICE_COUNT_BY_STATUS:
+            DEVICE_COUNT_BY_STATUS["online"].set(metrics.devices_online)
+            DEVICE_COUNT_BY_STATUS["offline"].set(metrics.devices_offline)
         if DEVICE_ONLINE is not None:
             DEVICE_ONLINE.set(metrics.devices_online)
         if EXIT_NODES is not None:
@@ -490,7 +508,7 @@ class TailscaleMonitor:
         else:
             return "stable"
 
-    async def _generate_alerts(self, metrics: NetworkMetrics) -> list[dict[str, Any]]:
+    def _generate_alerts(self, metrics: NetworkMetrics) -> list[dict[str, Any]]:
         """Generate network alerts."""
         alerts = []
 
@@ -514,7 +532,7 @@ class TailscaleMonitor:
 
         return alerts
 
-    async def _generate_recommendations(self, metrics: NetworkMetrics) -> list[str]:
+    def _generate_recommendations(self, metrics: NetworkMetrics) -> list[str]:
         """Generate network recommendations."""
         recommendations = []
 
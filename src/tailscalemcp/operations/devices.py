@@ -62,11 +62,12 @@ class DeviceOperations:
             if online_only:
                 devices = [d for d in devices if d.status == DeviceStatus.ONLINE]
 
-            # Filter by tags
+            # Filter by tags: the required set is built once, each check is a hash-based subset test
             if filter_tags:
-                devices = [d for d in devices if all(tag in d.tags for tag in filter_tags)]
+                required = frozenset(filter_tags)
+                devices = [d for d in devices if required.issubset(d.tags)]
 
-            logger.info(
+            logger.debug(
                 "Devices retrieved",
                 count=len(devices),
                 online_only=online_only,
@@ -78,6 +79,21 @@ class DeviceOperations:
             logger.error("Error listing devices", error=str(e))
             raise TailscaleMCPError(f"Failed to list devices: {e}") from e
 
+    async def list_devices_raw(self) -> list[dict[str, Any]]:
+        """List all devices in the tailnet as raw API dictionaries.
+
+        Returns:
+            List of device dictionaries as returned by the API
+
+        Raises:
+            TailscaleMCPError: If API call fails
+        """
+        try:
+            return await self.client.list_devices()
+        except Exception as e:
+            logger.error("Error listing devices", error=str(e))
+            raise TailscaleMCPError(f"Failed to list devices: {e}") from e
+
     async def get_device(self, device_id: str) -> Device:
         """Get device details by ID.
 
@@ -95,7 +111,7 @@ class DeviceOperations:
             device_data = await self.client.get_device(device_id)
             device = Device.from_api_response(device_data)
 
-            logger.info("Device retrieved", device_id=device_id, name=device.name)
+            logger.debug("Device retrieved", device_id=device_id, name=device.name)
             return device
 
         except NotFoundError:
@@ -200,9 +216,11 @@ class DeviceOperations:
         device = await self.get_device(device_id)
 
         if operation == "add":
-            new_tags = list(set(device.tags + tags))
+            # Existing order kept, new tags appended, duplicates dropped
+            new_tags = list(dict.fromkeys([*device.tags, *tags]))
         elif operation == "remove":
-            new_tags = [t for t in device.tags if t not in tags]
+            removed = set(tags)
+            new_tags = [t for t in device.tags if t not in removed]
         elif operation == "replace":
             new_tags = tags
         else:
@@ -271,7 +289,7 @@ class DeviceOperations:
                 if matched:
                     matching_devices.append(device)
 
-            logger.info(
+            logger.debug(
                 "Devices searched",
                 query=query,
                 search_fields=search_fields,
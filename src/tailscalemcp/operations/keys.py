@@ -148,14 +148,14 @@ class KeyOperations:
 
                 if key.get("expires"):
                     try:
-                        expires = datetime.fromisoformat(key["expires"].replace("Z", "+00:00"))
+                        expires = datetime.fromisoformat(key["expires"])
                         if expires < current_time:
                             expired.append(key_info)
                         elif (expires - current_time).days < 7:
                             expiring_soon.append(key_info)
                         else:
                             active.append(key_info)
-                    except (ValueError, KeyError):
+                    except (ValueError, TypeError):
                         active.append(key_info)
                 else:
                     active.append(key_info)
@@ -4,6 +4,7 @@ Reporting operations service layer.
 Provides report generation and export functionality.
 """
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Any
@@ -60,10 +61,18 @@ class ReportingOperations:
             analytics_ops = AnalyticsOperations(self.config)
             policy_ops = PolicyOperations(self.config)
 
-            # Gather data
-            devices = await device_ops.list_devices()
-            analytics = await analytics_ops.get_network_statistics()
-            policy = await policy_ops.get_policy()
+            # Gather data: the three fetches are independent API round trips, so overlap them
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    devices_task = tg.create_task(device_ops.list_devices())
+                    analytics_task = tg.create_task(analytics_ops.get_network_statistics())
+                    policy_task = tg.create_task(policy_ops.get_policy())
+            except ExceptionGroup as eg:
+                # Surface the first underlying failure rather than the group wrapper
+                raise eg.exceptions[0] from None
+            devices = devices_task.result()
+            analytics = analytics_task.result()
+            policy = policy_task.result()
 
             # Build report
             report = {
@@ -72,7 +72,7 @@ MonitorOperation = Literal[
     "export",
 ]
 
-MonitorDashboardExportType = Literal["comprehensive", "topology", "security"]
+MonitorDashboardExportType = Literal["comprehensive", "topology", "security", "all"]
 
 FileOperation = Literal[
     "send",
@@ -90,6 +90,22 @@ def register_monitor_tool(ctx: ToolContext) -> None:
             elif operation == "export":
                 if not filename:
                     raise TailscaleMCPError("filename is required for export operation")
+                if dashboard_type == "all":
+                    # One zip holding every dashboard instead of a file per dashboard
+                    dashboards = {
+                        "tailscale_comprehensive_dashboard.json": ctx.grafana_dashboard.create_comprehensive_dashboard(),
+                        "tailscale_topology_dashboard.json": ctx.grafana_dashboard.create_network_topology_dashboard(),
+                        "tailscale_security_dashboard.json": ctx.grafana_dashboard.create_security_dashboard(),
+                    }
+                    await ctx.grafana_dashboard.export_dashboard_archive(dashboards, filename)
+                    return {
+                        "operation": "export",
+                        "filename": filename,
+                        "dashboard_type": dashboard_type,
+                        "files": list(dashboards),
+                        "exported": True,
+                    }
+
                 if dashboard_type == "comprehensive":
                     dashboard_config = ctx.grafana_dashboard.create_comprehensive_dashboard()
                 elif dashboard_type == "topology":
@@ -99,7 +115,7 @@ def register_monitor_tool(ctx: ToolContext) -> None:
                 else:
                     raise TailscaleMCPError(f"Unknown dashboard type: {dashboard_type}")
 
-                ctx.grafana_dashboard.export_dashboard(dashboard_config, filename)
+                await ctx.grafana_dashboard.export_dashboard(dashboard_config, filename)
                 return {
                     "operation": "export",
                     "filename": filename,
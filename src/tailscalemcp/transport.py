@@ -32,10 +32,19 @@ import argparse
 import asyncio
 import logging
 import os
+import sys
 from typing import Literal
 
 import structlog
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 logger = structlog.get_logger(__name__)
 
 TransportType = Literal["stdio", "http", "sse"]
@@ -149,7 +158,11 @@ def resolve_transport(args: argparse.Namespace) -> TransportType:
         # Fall back to environment variable
         env_transport = os.getenv(ENV_TRANSPORT, "stdio").lower()
         if env_transport not in ("stdio", "http", "sse"):
-            logger.warning(f"Invalid {ENV_TRANSPORT}='{env_transport}', defaulting to stdio")
+            logger.warning(
+                "Invalid transport in environment, defaulting to stdio",
+                env_var=ENV_TRANSPORT,
+                value=env_transport,
+            )
             return "stdio"
         if env_transport == "sse":
             logger.warning("SSE transport is deprecated. Consider using MCP_TRANSPORT=http instead.")
@@ -193,8 +206,9 @@ def run_server(mcp_app, args: argparse.Namespace | None = None, server_name: str
     Raises:
         Exception: If server fails to start.
     """
-    # Simply run the async version
-    asyncio.run(run_server_async(mcp_app, args, server_name))
+    # Run the async version, on uvloop's event loop when it is installed
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    asyncio.run(run_server_async(mcp_app, args, server_name), loop_factory=loop_factory)
 
 
 async def run_server_async(mcp_app, args: argparse.Namespace | None = None, server_name: str = "mcp-server") -> None:
@@ -212,8 +226,9 @@ async def run_server_async(mcp_app, args: argparse.Namespace | None = None, serv
 
     # Configure logging
     if args.debug:
+        # structlog loggers filter on the stdlib level, so this enables their debug output too
         logging.getLogger().setLevel(logging.DEBUG)
-        logger.debug(f"Debug logging enabled for {server_name}")
+        logger.debug("Debug logging enabled", server_name=server_name)
 
     config = resolve_config(args)
     transport = config["transport"]
@@ -244,11 +259,11 @@ async def run_server_async(mcp_app, args: argparse.Namespace | None = None, serv
             host = config["host"]
             port = config["port"]
             logger.warning("SSE mode is deprecated. Migrate to HTTP Streamable (--http).")
-            logger.info(f"Running in SSE mode: http://{host}:{port}")
+            logger.info("Running in SSE mode", endpoint=f"http://{host}:{port}")
             await mcp_app.run_async(transport="sse", host=host, port=port)
 
     except asyncio.CancelledError:
-        logger.info(f"{server_name} task cancelled")
+        logger.info("Server task cancelled", server_name=server_name)
     except Exception as e:
         logger.error("Server failed", server_name=server_name, error=str(e), exc_info=True)
         raise
@@ -1,9 +1,12 @@
 """Unit tests for API client."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from tailscalemcp.client import api_client as api_client_module
 from tailscalemcp.client.api_client import TailscaleAPIClient
 from tailscalemcp.config import TailscaleConfig
 from tailscalemcp.exceptions import (
@@ -13,6 +16,13 @@ from tailscalemcp.exceptions import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep the process-wide response cache from leaking between tests."""
+    yield
+    api_client_module._RESPONSE_CACHE.clear()
+
+
 @pytest.fixture
 def config():
     """Create test configuration."""
@@ -72,6 +82,23 @@ async def test_get_device_success(api_client):
         assert device["name"] == "test-device"
 
 
+@pytest.mark.asyncio
+async def test_get_devices_bulk(api_client):
+    """Test concurrent device retrieval keeps order and reports per-device errors."""
+
+    async def fake_request(method, endpoint, **kwargs):
+        if endpoint == "/devices/missing":
+            raise NotFoundError("Device", "missing")
+        return {"id": endpoint.rsplit("/", 1)[-1]}
+
+    with patch.object(api_client, "_request", side_effect=fake_request):
+        results = await api_client.get_devices_bulk(["device1", "missing", "device2"], concurrency=2)
+
+    assert results[0] == {"id": "device1"}
+    assert isinstance(results[1], NotFoundError)
+    assert results[2] == {"id": "device2"}
+
+
 @pytest.mark.asyncio
 async def test_get_device_not_found(api_client):
     """Test device not found error."""
@@ -97,15 +124,126 @@ async def test_authentication_error(api_client):
 @pytest.mark.asyncio
 async def test_rate_limit_error(api_client):
     """Test rate limit error handling."""
-    with patch.object(api_client.client, "request", new_callable=AsyncMock) as mock_request:
+    with (
+        patch.object(api_client.client, "request", new_callable=AsyncMock) as mock_request,
+        patch("tailscalemcp.client.retry.precise_sleep", new_callable=AsyncMock),
+    ):
         mock_response_obj = AsyncMock()
         mock_response_obj.status_code = 429
+        mock_response_obj.headers = {}
         mock_request.return_value = mock_response_obj
 
         with pytest.raises(RateLimitExceededError):
             await api_client.list_devices()
 
 
+@pytest.mark.asyncio
+async def test_rate_limit_retries_after_retry_after(api_client):
+    """Test a 429 is retried after the server's Retry-After delay."""
+    request = httpx.Request("GET", api_client._url("/devices"))
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}, request=request),
+        httpx.Response(200, json={"devices": [{"id": "device1"}]}, request=request),
+    ]
+    with (
+        patch.object(api_client.client, "request", new=AsyncMock(side_effect=responses)) as mock_request,
+        patch("tailscalemcp.client.retry.precise_sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        result = await api_client._send("GET", "/devices")
+
+    assert result == {"devices": [{"id": "device1"}]}
+    assert mock_request.await_count == 2
+    (delay,) = mock_sleep.await_args.args
+    assert 2.0 <= delay <= 2.25
+
+
+@pytest.mark.asyncio
+async def test_cached_get_and_invalidation(api_client):
+    """Test cacheable GETs are served from cache until a mutation on the same endpoint."""
+    with patch.object(api_client, "_send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = {"devices": [{"id": "device1"}]}
+
+        await api_client.list_devices()
+        cached = await api_client.list_devices()
+        assert mock_send.await_count == 1
+
+        # Hits are copies, so callers can't corrupt the cached response
+        cached[0]["id"] = "mutated"
+        assert (await api_client.list_devices())[0]["id"] == "device1"
+
+        await api_client.delete_device("device1")
+        await api_client.list_devices()
+        assert mock_send.await_count == 3
+
+        # Mutations outside /devices (e.g. batch posture attributes) still invalidate
+        await api_client.batch_update_device_posture_attributes({})
+        await api_client.list_devices()
+        assert mock_send.await_count == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not api_client_module.IJSON_AVAILABLE, reason="ijson not installed")
+async def test_iter_devices_retries_rate_limit_then_streams(api_client):
+    """Test the device stream is opened through the retry handler and parsed incrementally."""
+    request = httpx.Request("GET", api_client._url("/devices"))
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "1"}, request=request),
+        httpx.Response(200, content=b'{"devices": [{"id": "d1"}, {"id": "d2"}]}', request=request),
+    ]
+    with (
+        patch.object(api_client.client, "send", new=AsyncMock(side_effect=responses)) as mock_send,
+        patch("tailscalemcp.client.retry.precise_sleep", new_callable=AsyncMock),
+    ):
+        devices = [device async for device in api_client.iter_devices()]
+
+    assert [d["id"] for d in devices] == ["d1", "d2"]
+    assert mock_send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_request_metrics_flush_without_further_requests():
+    """Test counts recorded just after a flush are published once the interval passes."""
+    with patch.object(api_client_module, "METRICS_FLUSH_INTERVAL", 0.001):
+        api_client_module.flush_api_request_metrics()
+        api_client_module._last_metrics_flush = float("inf")  # force the deferred path
+        api_client_module._record_api_request("/devices", "200")
+        assert api_client_module._pending_api_requests
+        # Timers fire in deadline order, so the 1 ms flush runs before this sleep returns
+        await asyncio.sleep(0.01)
+
+    assert not api_client_module._pending_api_requests
+
+
+def test_shared_client_is_per_event_loop(config):
+    """Test each event loop gets its own pooled client, closed with its last user."""
+
+    async def use_client() -> httpx.AsyncClient:
+        client = TailscaleAPIClient(config=config)
+        http_client = client.client
+        await client.close()
+        return http_client
+
+    first = asyncio.run(use_client())
+    second = asyncio.run(use_client())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_not_shared_across_api_keys(api_client):
+    """Test a client with different credentials for the same tailnet misses the cache."""
+    other = TailscaleAPIClient(api_key="tskey-other", tailnet=api_client.tailnet)
+    with (
+        patch.object(api_client, "_send", new=AsyncMock(return_value={"devices": [{"id": "mine"}]})),
+        patch.object(other, "_send", new=AsyncMock(return_value={"devices": []})) as other_send,
+    ):
+        await api_client.list_devices()
+        assert await other.list_devices() == []
+
+    assert other_send.await_count == 1
+
+
 @pytest.mark.asyncio
 async def test_context_manager(api_client):
     """Test context manager support."""
@@ -0,0 +1,122 @@
+"""Unit tests for the advanced device manager."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tailscalemcp.client.api_client import TailscaleAPIClient
+from tailscalemcp.device_management import AdvancedDeviceManager
+from tailscalemcp.exceptions import AuthenticationError, TailscaleMCPError
+
+
+def _device(device_id: str, tags: list[str] | None = None) -> dict:
+    return {"id": device_id, "name": device_id, "hostname": f"{device_id}-host", "os": "linux", "tags": tags or []}
+
+
+@pytest.fixture
+def manager():
+    """Create a device manager for testing."""
+    return AdvancedDeviceManager(api_key="tskey-test", tailnet="test.tailnet.ts.net")
+
+
+@pytest.mark.asyncio
+async def test_list_devices_is_cached(manager):
+    """Test repeated listings within the TTL reuse one API result."""
+    with patch.object(manager.api_client, "list_devices", new=AsyncMock(return_value=[_device("d1")])) as mock_list:
+        first = await manager.list_devices()
+        second = await manager.list_devices()
+
+    assert [d["id"] for d in first] == [d["id"] for d in second] == ["d1"]
+    assert mock_list.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_result_served_on_api_error(manager):
+    """Test an expired cache entry is served when the refresh fails."""
+    with patch.object(
+        manager.api_client,
+        "list_devices",
+        new=AsyncMock(side_effect=[[_device("d1")], TailscaleMCPError("boom")]),
+    ):
+        await manager.list_devices()
+        # Expire the entry without waiting for the TTL
+        manager._cache = {k: v._replace(stale_at=0.0) for k, v in manager._cache.items()}
+        devices = await manager.list_devices()
+
+    assert [d["id"] for d in devices] == ["d1"]
+
+
+@pytest.mark.asyncio
+async def test_stale_result_not_served_on_auth_error(manager):
+    """Test a revoked key surfaces as an error instead of serving the stale entry."""
+    with patch.object(
+        manager.api_client,
+        "list_devices",
+        new=AsyncMock(side_effect=[[_device("d1")], AuthenticationError("revoked")]),
+    ):
+        await manager.list_devices()
+        manager._cache = {k: v._replace(stale_at=0.0) for k, v in manager._cache.items()}
+        with pytest.raises(TailscaleMCPError):
+            await manager.list_devices()
+
+
+@pytest.mark.asyncio
+async def test_writes_through_other_clients_invalidate_cache(manager):
+    """Test a write made through a different API client clears the manager's cache."""
+    other = TailscaleAPIClient(api_key="tskey-test", tailnet="test.tailnet.ts.net")
+    with (
+        patch.object(manager.api_client, "list_devices", new=AsyncMock(return_value=[_device("d1")])) as mock_list,
+        patch.object(other, "_send", new=AsyncMock(return_value={})),
+    ):
+        await manager.list_devices()
+        await other.delete_device("d1")
+        await manager.list_devices()
+
+    assert mock_list.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tag_search_and_statistics_share_one_fetch(manager):
+    """Test tag listing, search and statistics are served from a single device fetch."""
+    raw = [_device("web1", ["tag:web"]), _device("db1", ["tag:db"])]
+    with patch.object(manager.api_client, "list_devices", new=AsyncMock(return_value=raw)) as mock_list:
+        by_tag = await manager.list_devices_by_tag("tag:web")
+        found = await manager.search_devices("DB")
+        stats = await manager.get_device_statistics()
+
+    assert [d["id"] for d in by_tag] == ["web1"]
+    assert [d["device_id"] for d in found] == ["db1"]
+    assert stats["total_devices"] == 2
+    assert mock_list.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_fetch(manager):
+    """Test concurrent cache misses for the same key coalesce into one API call."""
+    with patch.object(manager.api_client, "list_devices", new=AsyncMock(return_value=[_device("d1")])) as mock_list:
+        results = await asyncio.gather(
+            manager.list_devices(),
+            manager.search_devices("d1"),
+            manager.get_device_statistics(),
+        )
+
+    assert results[2]["total_devices"] == 1
+    assert mock_list.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_authorize_devices_reports_per_device_status(manager):
+    """Test bulk authorization returns one status per device, including failures."""
+
+    async def update(device_id, payload):
+        if device_id == "bad":
+            raise TailscaleMCPError("not found")
+        return {"id": device_id, **payload}
+
+    with patch.object(manager.api_client, "update_device", new=AsyncMock(side_effect=update)):
+        statuses = await manager.authorize_devices(["d1", "bad", "d2"])
+
+    assert [s["device_id"] for s in statuses] == ["d1", "bad", "d2"]
+    assert [s["success"] for s in statuses] == [True, False, True]
+    assert statuses[0]["result"]["authorized"] is True
@@ -0,0 +1,43 @@
+"""Unit tests for the API rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tailscalemcp.client.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def frozen_clock():
+    """Freeze the limiter's loop clock at 0 and record requested sleeps instead of waiting."""
+    with (
+        patch.object(RateLimiter, "_loop_time", return_value=0.0),
+        patch("tailscalemcp.client.rate_limiter.precise_sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        yield mock_sleep
+
+
+def _limiter(rate: float) -> RateLimiter:
+    limiter = RateLimiter(rate=rate, window=1)
+    limiter.last_refill = 0.0
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_burst_up_to_capacity_is_immediate(frozen_clock):
+    """Test requests within the bucket capacity do not wait."""
+    limiter = _limiter(10.0)
+    for _ in range(10):
+        await limiter.acquire()
+    frozen_clock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_are_paced_not_serialized(frozen_clock):
+    """Test concurrent callers past capacity get consecutive slots at the refill rate."""
+    limiter = _limiter(50.0)
+    await asyncio.gather(*(limiter.acquire() for _ in range(60)))
+    # 50 immediate, then the next 10 are scheduled 1/50s apart rather than each waiting in turn
+    waits = [call.args[0] for call in frozen_clock.await_args_list]
+    assert waits == pytest.approx([n / 50.0 for n in range(1, 11)])
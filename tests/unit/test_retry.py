@@ -0,0 +1,50 @@
+"""Unit tests for the API retry handler."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from tailscalemcp.client.retry import RetryHandler
+from tailscalemcp.exceptions import TailscaleAPIError
+
+
+def _status_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.tailscale.com/api/v2/tailnet/example/devices")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_retry_after_seconds_is_used():
+    """Test a numeric Retry-After header is read from the wrapped httpx error."""
+    handler = RetryHandler()
+    try:
+        raise TailscaleAPIError("API request failed: 503") from _status_error(503, {"Retry-After": "7"})
+    except TailscaleAPIError as e:
+        assert handler._should_retry(e)
+        assert handler._retry_after(e) == 7.0
+
+
+def test_wrapped_ambiguous_errors_are_not_retried():
+    """Test wrapped 5xx (other than 503) and network errors are not re-sent."""
+    handler = RetryHandler()
+    errors = [_status_error(500), httpx.ConnectError("reset")]
+    for cause in errors:
+        try:
+            raise TailscaleAPIError("API request failed") from cause
+        except TailscaleAPIError as e:
+            assert not handler._should_retry(e)
+
+
+@pytest.mark.asyncio
+async def test_execute_sleeps_for_retry_after():
+    """Test execute waits for Retry-After instead of the backoff delay."""
+    handler = RetryHandler(max_retries=1)
+    func = AsyncMock(side_effect=[_status_error(429, {"Retry-After": "2"}), {"ok": True}])
+
+    with patch("tailscalemcp.client.retry.precise_sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await handler.execute(func)
+
+    assert result == {"ok": True}
+    delay = mock_sleep.await_args.args[0]
+    assert 2.0 <= delay <= 2.25